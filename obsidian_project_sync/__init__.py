@@ -8,9 +8,24 @@ __version__ = "0.1.0"
 __author__ = "MinDong Sung"
 __email__ = "mdskylover@gmail.com"
 
-from .config import ProjectConfig
-from .sync_manager import ObsidianSyncManager
-from .conflict_resolver import ConflictResolver, NewerWinsResolver, LocalWinsResolver, ObsidianWinsResolver
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import ProjectConfig
+    from .sync_manager import ObsidianSyncManager
+    from .conflict_resolver import ConflictResolver, NewerWinsResolver, LocalWinsResolver, ObsidianWinsResolver
+
+# Public names are imported on first access so that light commands
+# (e.g. `obsidian-sync --help`) don't pay for requests/yaml/dotenv imports
+_LAZY_IMPORTS = {
+    "ProjectConfig": ".config",
+    "ObsidianSyncManager": ".sync_manager",
+    "ConflictResolver": ".conflict_resolver",
+    "NewerWinsResolver": ".conflict_resolver",
+    "LocalWinsResolver": ".conflict_resolver",
+    "ObsidianWinsResolver": ".conflict_resolver",
+}
 
 __all__ = [
     "ProjectConfig",
@@ -19,4 +34,14 @@ __all__ = [
     "NewerWinsResolver",
     "LocalWinsResolver", 
     "ObsidianWinsResolver",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,19 +4,17 @@ Command Line Interface for Obsidian Project Sync
 """
 
 import click
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
+from typing import TYPE_CHECKING, Optional
+from rich import get_console, print as rprint
 
-from .config import ProjectConfig
-from .sync_manager import ObsidianSyncManager
-from .init_project import ProjectInitializer
-
-console = Console()
+# Heavy modules (rich tables, requests, yaml) are imported inside the
+# commands that need them to keep `--help`/`--version` startup fast
+if TYPE_CHECKING:
+    from .config import ProjectConfig
+    from .sync_manager import ObsidianSyncManager
 
 
 @click.group()
@@ -33,6 +31,8 @@ def main():
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing configuration")
 def init(project_name: Optional[str], vault_path: Optional[str], notes_dir: str, force: bool):
     """Initialize Obsidian sync in current project"""
+    from .init_project import ProjectInitializer
+    
     try:
         initializer = ProjectInitializer()
         success = initializer.initialize_project(
@@ -65,11 +65,14 @@ def init(project_name: Optional[str], vault_path: Optional[str], notes_dir: str,
               help="Override log level")
 def sync(watch: bool, interval: Optional[int], dry_run: bool, log_level: Optional[str]):
     """Run synchronization between local notes and Obsidian vault"""
+    from .config import ProjectConfig
+    from .sync_manager import ObsidianSyncManager
+    
     try:
         config = ProjectConfig()
         
         if log_level:
-            config._yaml_config.setdefault('logging', {})['level'] = log_level
+            config.override('logging.level', log_level)
         
         sync_manager = ObsidianSyncManager(config, dry_run=dry_run)
         
@@ -80,7 +83,7 @@ def sync(watch: bool, interval: Optional[int], dry_run: bool, log_level: Optiona
             rprint(f"👀 [blue]Starting continuous monitoring mode...[/blue]")
             if interval:
                 rprint(f"⏰ Sync interval: {interval} seconds")
-            sync_manager.watch_mode(interval)
+            sync_manager.watch_mode(interval, on_sync=functools.partial(_display_sync_results, compact=True))
         else:
             rprint("🔄 [blue]Running one-time synchronization...[/blue]")
             results = sync_manager.bidirectional_sync()
@@ -97,6 +100,9 @@ def sync(watch: bool, interval: Optional[int], dry_run: bool, log_level: Optiona
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed connection information")
 def test(verbose: bool):
     """Test connection to Obsidian Local REST API"""
+    from .config import ProjectConfig
+    from .sync_manager import ObsidianSyncManager
+    
     try:
         config = ProjectConfig()
         sync_manager = ObsidianSyncManager(config)
@@ -129,6 +135,8 @@ def test(verbose: bool):
               default='table', help="Output format")
 def config(format: str):
     """Show current configuration"""
+    from .config import ProjectConfig
+    
     try:
         config = ProjectConfig()
         summary = config.get_config_summary()
@@ -139,8 +147,15 @@ def config(format: str):
             import yaml
             print(yaml.dump(summary, default_flow_style=False))
         elif format == 'json':
-            import json
-            print(json.dumps(summary, indent=2))
+            try:
+                import orjson
+            except ImportError:
+                import json
+                print(json.dumps(summary, indent=2))
+            else:
+                sys.stdout.buffer.write(
+                    orjson.dumps(summary, default=str, option=orjson.OPT_INDENT_2) + b"\n"
+                )
             
     except Exception as e:
         rprint(f"❌ [red]Error: {e}[/red]")
@@ -151,6 +166,9 @@ def config(format: str):
 @click.option("--max-backups", "-m", type=int, help="Maximum number of backups to keep")
 def backup(max_backups: Optional[int]):
     """Create manual backup of notes directory"""
+    from .config import ProjectConfig
+    from .sync_manager import ObsidianSyncManager
+    
     try:
         config = ProjectConfig()
         sync_manager = ObsidianSyncManager(config)
@@ -173,7 +191,7 @@ def backup(max_backups: Optional[int]):
         sys.exit(1)
 
 
-def _check_connection(sync_manager: ObsidianSyncManager) -> bool:
+def _check_connection(sync_manager: "ObsidianSyncManager") -> bool:
     """Check API connection before sync operations"""
     if not sync_manager.test_connection():
         rprint("❌ [red]Cannot connect to Obsidian API[/red]")
@@ -182,8 +200,15 @@ def _check_connection(sync_manager: ObsidianSyncManager) -> bool:
     return True
 
 
-def _display_sync_results(results: dict):
+def _display_sync_results(results: dict, compact: bool = False):
     """Display sync operation results"""
+    if compact:
+        # One pre-formatted line per cycle for watch mode
+        click.echo(_format_compact_results(results))
+        return
+    
+    from rich.table import Table
+    
     table = Table(title="🔄 Sync Results")
     table.add_column("Direction", style="cyan")
     table.add_column("Created", style="green")
@@ -210,7 +235,7 @@ def _display_sync_results(results: dict):
         str(obs_to_local["errors"])
     )
     
-    console.print(table)
+    get_console().print(table)
     
     duration = results.get("duration_seconds", 0)
     rprint(f"⏱️ Completed in {duration:.2f} seconds")
@@ -219,8 +244,23 @@ def _display_sync_results(results: dict):
         rprint(f"💾 Backup created: {results['backup_path']}")
 
 
-def _display_connection_details(config: ProjectConfig, notes: list):
+def _format_compact_results(results: dict) -> str:
+    """Format sync results as a single line"""
+    parts = []
+    for label, key in (("L→O", "local_to_obsidian"), ("O→L", "obsidian_to_local")):
+        stats = results[key]
+        parts.append(
+            f"{click.style(label, fg='cyan')} "
+            f"+{stats['created']}/~{stats['updated']}/-{stats['skipped']}/!{stats['errors']}"
+        )
+    parts.append(f"{results.get('duration_seconds', 0):.2f}s")
+    return "  ".join(parts)
+
+
+def _display_connection_details(config: "ProjectConfig", notes: list):
     """Display detailed connection information"""
+    from rich.table import Table
+    
     table = Table(title="🔌 Connection Details")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="white")
@@ -231,7 +271,7 @@ def _display_connection_details(config: ProjectConfig, notes: list):
     table.add_row("Local Notes", str(config.local_notes_dir))
     table.add_row("Notes Found", str(len(notes)))
     
-    console.print(table)
+    get_console().print(table)
     
     if notes:
         rprint("\n📝 [blue]Available notes:[/blue]")
@@ -245,6 +285,8 @@ def _display_connection_details(config: ProjectConfig, notes: list):
 
 def _display_config_table(summary: dict):
     """Display configuration as a table"""
+    from rich.table import Table
+    
     table = Table(title="⚙️ Current Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="white")
@@ -256,11 +298,13 @@ def _display_config_table(summary: dict):
             value = str(value)
         table.add_row(key.replace("_", " ").title(), str(value))
     
-    console.print(table)
+    get_console().print(table)
 
 
-def _display_troubleshooting_tips(config: Optional[ProjectConfig]):
+def _display_troubleshooting_tips(config: Optional["ProjectConfig"]):
     """Display troubleshooting information"""
+    from rich.panel import Panel
+    
     panel = Panel.fit(
         """[bold yellow]Troubleshooting Tips:[/bold yellow]
 
@@ -285,7 +329,7 @@ def _display_troubleshooting_tips(config: Optional[ProjectConfig]):
         title="❓ Help",
         border_style="yellow"
     )
-    console.print(panel)
+    get_console().print(panel)
 
 
 if __name__ == "__main__":
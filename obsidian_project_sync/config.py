@@ -5,17 +5,193 @@ Environment variables (.env) + YAML configuration (config.yml) integrated manage
 """
 
 import os
+import re
+import stat
+import json
+import fnmatch
+import secrets
 import yaml
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
-from dotenv import load_dotenv
+from typing import Optional, Dict, Any, Iterator, Set, Tuple, Union
+from dotenv import dotenv_values
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# Prefer libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Environment variables that must be set (and non-empty)
+_REQUIRED_ENV_VARS = ('OBSIDIAN_API_HOST', 'OBSIDIAN_API_KEY')
+
+# Environment-backed settings and their defaults
+_ENV_DEFAULTS = {
+    'OBSIDIAN_API_HOST': 'https://localhost:27124',
+    'OBSIDIAN_API_KEY': '',
+    'SLACK_WEBHOOK_URL': '',
+    'DISCORD_WEBHOOK_URL': '',
+    'NGROK_AUTH_TOKEN': '',
+    'NGROK_DOMAIN': '',
+}
+
+# Parsed .env contents keyed by path, with the mtime they were parsed at
+_ENV_CACHE: Dict[Path, Tuple[int, Dict[str, Optional[str]]]] = {}
+
+# Pre-rendered default configuration file, kept in sync with
+# ProjectConfig._get_default_config()
+_DEFAULT_CONFIG_YAML = """\
+obsidian:
+  vault_project_path: {vault_project_path}
+  local_notes_dir: notes
+sync:
+  interval_seconds: 30
+  min_interval_seconds: 10
+  max_interval_seconds: 300
+  conflict_resolution: newer_wins
+  create_backup: true
+  max_workers: 8
+  compress_uploads: false
+logging:
+  level: INFO
+  file: logs/obsidian_sync.log
+  max_file_size_mb: 10
+  backup_count: 5
+filters:
+  include_extensions:
+  - .md
+  exclude_patterns:
+  - .*
+  - '*.tmp'
+  - '*.bak'
+backup:
+  max_backups: 10
+  cleanup_old_backups: true
+  backup_before_sync: true
+notifications:
+  enable_slack: false
+  enable_discord: false
+  notify_on_success: false
+  notify_on_error: true
+"""
+
+# Background log listeners that still need to be flushed at exit
+_LOG_LISTENERS: Set[QueueListener] = set()
+
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush pending records and close the listener's handlers"""
+    _LOG_LISTENERS.discard(listener)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_log_listeners() -> None:
+    for listener in list(_LOG_LISTENERS):
+        _stop_log_listener(listener)
+
+
+def _create_temp_file(directory: Path) -> Tuple[int, Path]:
+    """Create a new hidden temp file in directory, with its mode left to the umask"""
+    while True:
+        tmp_path = directory / f".obsidian-sync-{secrets.token_hex(6)}.tmp"
+        try:
+            # Like open(), 0o666 lets the umask decide the new file's permissions
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _atomic_write_bytes(path: Union[str, Path], data: bytes, fsync: bool = True) -> None:
+    """
+    Write data to a temp file in the same directory, then rename over the target
+    
+    With fsync=False the data is not flushed to disk before the rename: readers
+    still never see a partial file, but a power loss may leave the old content.
+    """
+    # Replace a symlink's target rather than the link itself
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # New file: keep the umask-derived mode the temp file was created with
+        mode = None
+    
+    fd, tmp_path = _create_temp_file(path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _SizeTrackingRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that tracks file size in memory instead of seeking per record"""
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Defer opening the log file until the first record is written
+        kwargs.setdefault('delay', True)
+        super().__init__(*args, **kwargs)
+        self._bytes_written: Optional[int] = None
+        self._can_rollover = True
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # Without backups a rollover only reopens the same file, so skip the tracking
+        if self.maxBytes <= 0 or self.backupCount <= 0:
+            return False
+        
+        if self._bytes_written is None:
+            self._bytes_written = 0
+            try:
+                st = os.stat(self.baseFilename)
+            except OSError:
+                pass
+            else:
+                # Like the stdlib (bpo-45401): never rename special files such as /dev/null
+                self._can_rollover = stat.S_ISREG(st.st_mode)
+                self._bytes_written = st.st_size
+        
+        if not self._can_rollover:
+            return False
+        
+        msg = f"{self.format(record)}{self.terminator}"
+        size = len(msg.encode(self.encoding or 'utf-8', errors='replace'))
+        if self._bytes_written and self._bytes_written + size >= self.maxBytes:
+            return True
+        
+        self._bytes_written += size
+        return False
+    
+    def doRollover(self) -> None:
+        super().doRollover()
+        # Re-read the size on the next record so writes by other processes
+        # sharing this log are picked up instead of drifting from the count
+        self._bytes_written = None
 
 
 class ProjectConfig:
     """Project configuration management class"""
     
+    __slots__ = (
+        'project_root', 'env_file', 'config_file', 'yaml_config',
+        '_project_name', '_default_vault', '_vault_project_path',
+        '_local_notes_dir', '_log_file', '_flat', '_include_exts',
+        '_exclude_re', '_env', '_summary_cache', '_log_listener',
+    )
+    
     def __init__(self, project_root: Optional[Union[str, Path]] = None):
         """
         Initialize configuration
@@ -23,69 +199,108 @@ class ProjectConfig:
         Args:
             project_root: Project root path (None for auto-detection)
         """
+        self._log_listener: Optional[QueueListener] = None
+        
         # Set project root
         if project_root:
             self.project_root = Path(project_root)
         else:
             # Auto-detect project root (current working directory)
             self.project_root = Path.cwd()
+        self._project_name = self.project_root.name
+        self._default_vault = f'10-Projects/{self._project_name}'
         
-        # Configuration file paths
+        # Configuration file paths (config_file is finalized when loading YAML)
         self.env_file = self.project_root / ".env"
         self.config_file = self.project_root / "config" / "obsidian-sync.yml"
         
-        # Fallback config file path (for backward compatibility)
-        if not self.config_file.exists():
-            self.config_file = self.project_root / "obsidian-sync.yml"
-        
         # Load environment variables
         self._load_env()
         
         # Load YAML configuration
         self._load_yaml_config()
+        self._refresh_settings()
         
         # Validate configuration
         self._validate_config()
+        
+        # Snapshot environment-backed settings
+        self.refresh_env()
     
     def _load_env(self):
         """Load environment variables"""
-        if self.env_file.exists():
-            load_dotenv(self.env_file)
-        else:
-            # Try to load from parent directories
-            current = self.project_root
-            for _ in range(3):  # Check up to 3 levels up
-                env_path = current / ".env"
-                if env_path.exists():
-                    load_dotenv(env_path)
-                    break
-                current = current.parent
+        # Search every time: a .env created closer to the project takes over,
+        # and the search is the same handful of stats that checking a cached
+        # path against its closer candidates would need
+        found = self._find_env_file()
+        if found is None:
+            return
+        env_path, mtime_ns = found
+        
+        # Re-parse only when the file changed since the last load
+        cached = _ENV_CACHE.get(env_path)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, dotenv_values(env_path))
+            _ENV_CACHE[env_path] = cached
+        
+        # Like load_dotenv(), never override variables that are already set
+        for key, value in cached[1].items():
+            if value is not None and key not in os.environ:
+                os.environ[key] = value
+    
+    def _find_env_file(self) -> Optional[Tuple[Path, int]]:
+        """Find .env in project root or its parent directories, with its mtime"""
+        # Check project root and up to 3 levels up, one stat per directory
+        for directory in (self.project_root, *self.project_root.parents)[:4]:
+            env_path = directory / ".env"
+            try:
+                mtime_ns = os.stat(env_path).st_mtime_ns
+            except OSError:
+                continue
+            return env_path, mtime_ns
+        return None
     
     def _load_yaml_config(self):
         """Load YAML configuration file"""
-        try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.yaml_config = yaml.safe_load(f) or {}
-        except FileNotFoundError:
-            # Create default configuration
-            self.yaml_config = self._get_default_config()
-            # Optionally create the config file
-            self._create_default_config_file()
-        except yaml.YAMLError as e:
-            raise ValueError(f"YAML parsing error in {self.config_file}: {e}")
+        # Open candidates directly instead of probing with exists();
+        # the second one is the fallback path (for backward compatibility)
+        candidates = (self.config_file, self.project_root / "obsidian-sync.yml")
+        for config_file in candidates:
+            try:
+                # Binary mode lets the YAML loader decode the stream itself
+                f = open(config_file, 'rb')
+            except FileNotFoundError:
+                continue
+            
+            self.config_file = config_file
+            with f:
+                try:
+                    self.yaml_config = yaml.load(f, Loader=_YAML_LOADER) or {}
+                except yaml.YAMLError as e:
+                    raise ValueError(f"YAML parsing error in {self.config_file}: {e}")
+            return
+        
+        # Create default configuration at the fallback path
+        self.config_file = candidates[-1]
+        self.yaml_config = self._get_default_config()
+        # Optionally create the config file
+        self._create_default_config_file()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
-        project_name = self.project_root.name
         return {
             'obsidian': {
-                'vault_project_path': f'10-Projects/{project_name}',
+                'vault_project_path': self._default_vault,
                 'local_notes_dir': 'notes'
             },
             'sync': {
                 'interval_seconds': 30,
+                'min_interval_seconds': 10,
+                'max_interval_seconds': 300,
                 'conflict_resolution': 'newer_wins',
-                'create_backup': True
+                'create_backup': True,
+                'max_workers': 8,
+                'compress_uploads': False
             },
             'logging': {
                 'level': 'INFO',
@@ -114,29 +329,57 @@ class ProjectConfig:
         """Create default configuration file"""
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.yaml_config, f, default_flow_style=False, 
-                         allow_unicode=True, sort_keys=False)
+            vault_project_path = json.dumps(self._default_vault, ensure_ascii=False)
+            _atomic_write_bytes(
+                self.config_file,
+                _DEFAULT_CONFIG_YAML.format(vault_project_path=vault_project_path).encode('utf-8')
+            )
         except Exception:
             # Silent fail - not critical
             pass
     
+    def _write_config_file(self) -> None:
+        """Atomically write YAML configuration to the config file"""
+        self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        data = yaml.dump(self.yaml_config, Dumper=_YAML_DUMPER, default_flow_style=False,
+                         allow_unicode=True, sort_keys=False, encoding='utf-8')
+        _atomic_write_bytes(self.config_file, data)
+    
+    def _refresh_settings(self) -> None:
+        """Flatten YAML configuration into dotted key paths for fast lookups"""
+        flat: Dict[str, Any] = {}
+        stack = [('', self.yaml_config)]
+        while stack:
+            prefix, node = stack.pop()
+            # A non-mapping YAML document has no settings; defaults apply
+            if not isinstance(node, dict):
+                continue
+            for key, value in node.items():
+                key_path = f"{prefix}{key}"
+                flat[key_path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{key_path}.", value))
+        self._flat = flat
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._vault_project_path = self._get_yaml_value('obsidian.vault_project_path', self._default_vault)
+        self._local_notes_dir = self.project_root / self._get_yaml_value('obsidian.local_notes_dir', 'notes')
+        self._log_file = self.project_root / self._get_yaml_value('logging.file', 'logs/obsidian_sync.log')
+        
+        # Precompile file filters used per file during sync
+        self._include_exts = tuple(self.include_extensions)
+        patterns = self.exclude_patterns
+        self._exclude_re = re.compile(
+            '|'.join(f'(?:{fnmatch.translate(os.path.normcase(p))})' for p in patterns)
+        ) if patterns else None
+    
     def _get_yaml_value(self, key_path: str, default: Any = None) -> Any:
         """Get nested key value from YAML configuration"""
-        keys = key_path.split('.')
-        value = self.yaml_config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat.get(key_path, default)
     
     def _validate_config(self):
         """Validate configuration"""
-        required_env_vars = ['OBSIDIAN_API_HOST', 'OBSIDIAN_API_KEY']
-        missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+        environ = os.environ
+        missing_vars = [var for var in _REQUIRED_ENV_VARS if not environ.get(var)]
         
         if missing_vars:
             raise ValueError(
@@ -144,45 +387,65 @@ class ProjectConfig:
                 f"Please create a .env file with these variables or set them in your environment."
             )
     
+    def refresh_env(self) -> None:
+        """Re-read environment-backed settings from the process environment"""
+        self._env = {name: os.getenv(name, default) for name, default in _ENV_DEFAULTS.items()}
+        self._summary_cache = None
+    
     # Security settings (from environment variables)
     @property
     def obsidian_api_host(self) -> str:
-        return os.getenv('OBSIDIAN_API_HOST', 'https://localhost:27124')
+        return self._env['OBSIDIAN_API_HOST']
     
     @property
     def obsidian_api_key(self) -> str:
-        return os.getenv('OBSIDIAN_API_KEY', '')
+        return self._env['OBSIDIAN_API_KEY']
     
     @property
     def slack_webhook_url(self) -> str:
-        return os.getenv('SLACK_WEBHOOK_URL', '')
+        return self._env['SLACK_WEBHOOK_URL']
     
     @property
     def discord_webhook_url(self) -> str:
-        return os.getenv('DISCORD_WEBHOOK_URL', '')
+        return self._env['DISCORD_WEBHOOK_URL']
     
     @property
     def ngrok_auth_token(self) -> str:
-        return os.getenv('NGROK_AUTH_TOKEN', '')
+        return self._env['NGROK_AUTH_TOKEN']
     
     @property
     def ngrok_domain(self) -> str:
-        return os.getenv('NGROK_DOMAIN', '')
+        return self._env['NGROK_DOMAIN']
     
     # General settings (from YAML)
     @property
     def vault_project_path(self) -> str:
-        return self._get_yaml_value('obsidian.vault_project_path', f'10-Projects/{self.project_root.name}')
+        return self._vault_project_path
     
     @property
     def local_notes_dir(self) -> Path:
-        notes_dir = self._get_yaml_value('obsidian.local_notes_dir', 'notes')
-        return self.project_root / notes_dir
+        return self._local_notes_dir
     
     @property
     def sync_interval_seconds(self) -> int:
         return self._get_yaml_value('sync.interval_seconds', 30)
     
+    @property
+    def sync_min_interval_seconds(self) -> int:
+        return self._get_yaml_value('sync.min_interval_seconds', 10)
+    
+    @property
+    def sync_max_interval_seconds(self) -> int:
+        return self._get_yaml_value('sync.max_interval_seconds', 300)
+    
+    @property
+    def sync_max_workers(self) -> int:
+        return self._get_yaml_value('sync.max_workers', 8)
+    
+    @property
+    def sync_compress_uploads(self) -> bool:
+        return self._get_yaml_value('sync.compress_uploads', False)
+    
     @property
     def conflict_resolution(self) -> str:
         return self._get_yaml_value('sync.conflict_resolution', 'newer_wins')
@@ -197,8 +460,7 @@ class ProjectConfig:
     
     @property
     def log_file(self) -> Path:
-        log_file = self._get_yaml_value('logging.file', 'logs/obsidian_sync.log')
-        return self.project_root / log_file
+        return self._log_file
     
     @property
     def max_file_size_mb(self) -> int:
@@ -244,10 +506,33 @@ class ProjectConfig:
     def notify_on_error(self) -> bool:
         return self._get_yaml_value('notifications.notify_on_error', True)
     
+    def has_included_extension(self, file_name: str) -> bool:
+        """Check if file name ends with one of the included extensions"""
+        return file_name.endswith(self._include_exts)
+    
+    def is_excluded(self, file_name: str) -> bool:
+        """Check if file name matches any of the exclude patterns"""
+        return bool(self._exclude_re and self._exclude_re.match(os.path.normcase(file_name)))
+    
+    def iter_local_notes(self) -> Iterator[os.DirEntry]:
+        """Iterate files in the local notes directory that pass the file filters"""
+        try:
+            entries = os.scandir(self._local_notes_dir)
+        except FileNotFoundError:
+            return
+        
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if (name.endswith(self._include_exts)
+                        and not self.is_excluded(name)
+                        and entry.is_file()):
+                    yield entry
+    
     def setup_logging(self) -> logging.Logger:
         """Setup logging configuration"""
         # Create log directory
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._log_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Setup logger
         logger = logging.getLogger('obsidian_sync')
@@ -256,10 +541,11 @@ class ProjectConfig:
         # Remove existing handlers to prevent duplicates
         if logger.handlers:
             logger.handlers.clear()
+        self.close()
         
-        # File handler (rotating log)
-        file_handler = RotatingFileHandler(
-            self.log_file, 
+        # File handler (rotating log, size tracked in memory)
+        file_handler = _SizeTrackingRotatingFileHandler(
+            self._log_file, 
             maxBytes=self.max_file_size_mb * 1024 * 1024, 
             backupCount=self.backup_count,
             encoding='utf-8'
@@ -268,7 +554,13 @@ class ProjectConfig:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        
+        # File writes and rotation run on a background thread
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._log_listener.start()
+        _LOG_LISTENERS.add(self._log_listener)
         
         # Console handler
         console_handler = logging.StreamHandler()
@@ -278,8 +570,20 @@ class ProjectConfig:
         
         return logger
     
+    def close(self) -> None:
+        """Flush and stop background logging started by setup_logging"""
+        if self._log_listener is not None:
+            _stop_log_listener(self._log_listener)
+            self._log_listener = None
+    
     def get_config_summary(self) -> Dict[str, Any]:
         """Get configuration summary information"""
+        if self._summary_cache is None:
+            self._summary_cache = self._build_config_summary()
+        return dict(self._summary_cache)
+    
+    def _build_config_summary(self) -> Dict[str, Any]:
+        """Build configuration summary from current settings"""
         return {
             'project_root': str(self.project_root),
             'vault_project_path': self.vault_project_path,
@@ -297,24 +601,32 @@ class ProjectConfig:
             'exclude_patterns': self.exclude_patterns,
         }
     
+    def override(self, key_path: str, value: Any) -> None:
+        """Override a setting for this session without saving to file"""
+        *parents, leaf = key_path.split('.')
+        node = self.yaml_config
+        for key in parents:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[leaf] = value
+        self._refresh_settings()
+    
     def update_config(self, updates: Dict[str, Any]) -> None:
         """Update configuration and save to file"""
-        # Deep merge updates into yaml_config
-        def deep_merge(base: dict, updates: dict) -> dict:
-            for key, value in updates.items():
-                if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                    deep_merge(base[key], value)
+        # Deep merge updates into yaml_config (iteratively, no recursion)
+        stack = [(self.yaml_config, updates)]
+        while stack:
+            base, changes = stack.pop()
+            for key, value in changes.items():
+                if isinstance(value, dict) and isinstance(base.get(key), dict):
+                    stack.append((base[key], value))
                 else:
                     base[key] = value
-            return base
-        
-        deep_merge(self.yaml_config, updates)
+        self._refresh_settings()
         
         # Save to file
         try:
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.yaml_config, f, default_flow_style=False, 
-                         allow_unicode=True, sort_keys=False)
+            self._write_config_file()
         except Exception as e:
             raise ValueError(f"Failed to save configuration: {e}")
\ No newline at end of file
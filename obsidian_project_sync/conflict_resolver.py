@@ -4,20 +4,95 @@ Conflict resolution strategies for Obsidian sync
 """
 
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Union
+from typing import Dict, Optional, Tuple, Type, Union
 from abc import ABC, abstractmethod
 
 
+# Note contents as handled by resolvers: decoded text or raw UTF-8 bytes
+NoteContent = Union[str, bytes]
+
+# Interactive conflict preview layout
+_PREVIEW_CHARS = 500
+_SEP30 = "-" * 30
+_SEP60 = "=" * 60
+
+# Zero-padded two-digit fields for backup timestamps
+_TWO = tuple(f"{i:02d}" for i in range(100))
+
+# Conflict backups at least this large are written concurrently
+_CONCURRENT_BACKUP_BYTES = 64 * 1024
+
+_backup_pool: Optional[ThreadPoolExecutor] = None
+_backup_pool_lock = threading.Lock()
+
+
+def _get_backup_pool() -> ThreadPoolExecutor:
+    """Get the shared worker used to write large conflict backups"""
+    global _backup_pool
+    with _backup_pool_lock:
+        if _backup_pool is None:
+            _backup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="conflict-backup")
+        return _backup_pool
+
+
+def _format_timestamp(sec: int) -> str:
+    """Format epoch seconds as a local YYYYMMDD_HHMMSS timestamp"""
+    t = time.localtime(sec)
+    return (
+        f"{t.tm_year}{_TWO[t.tm_mon]}{_TWO[t.tm_mday]}_"
+        f"{_TWO[t.tm_hour]}{_TWO[t.tm_min]}{_TWO[t.tm_sec]}"
+    )
+
+
+def _to_bytes(content: NoteContent) -> bytes:
+    """Encode content to UTF-8 unless it already is bytes"""
+    return content if isinstance(content, bytes) else content.encode('utf-8')
+
+
+def _preview(content: NoteContent) -> str:
+    """Decode only the leading preview slice of content for display"""
+    head = content[:_PREVIEW_CHARS]
+    if isinstance(head, bytes):
+        head = head.decode('utf-8', errors='replace')
+    return head + "..." if len(content) > _PREVIEW_CHARS else head
+
+
+def _read_file_bytes(file_path: Union[str, Path]) -> bytes:
+    """Read a whole file through a raw fd, sized from fstat"""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size or size == 0:
+            # Short read (or unknown size): keep reading until EOF
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
 class ConflictResolver(ABC):
     """Abstract base class for conflict resolution strategies"""
     
     @abstractmethod
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """
         Resolve conflict between local and Obsidian content
         
+        Both contents are either str or UTF-8 bytes, and the result has
+        the same type.
+        
         Args:
             local_content: Content from local file
             obsidian_content: Content from Obsidian vault
@@ -32,22 +107,23 @@ class ConflictResolver(ABC):
 class NewerWinsResolver(ConflictResolver):
     """Resolve conflicts by choosing the more recently modified content"""
     
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """Choose content based on modification time"""
+        # Identical content needs no mtime check
+        if local_content == obsidian_content:
+            return local_content
+        
         try:
-            local_path = Path(file_path)
-            
-            # If local file doesn't exist, use Obsidian content
-            if not local_path.exists():
+            # Get local file modification time with a single stat;
+            # if local file doesn't exist, use Obsidian content
+            try:
+                local_mtime = os.stat(file_path).st_mtime
+            except (FileNotFoundError, NotADirectoryError):
                 return obsidian_content
             
-            # Get local file modification time
-            local_mtime = local_path.stat().st_mtime
-            current_time = datetime.now().timestamp()
-            
             # If local file was modified within the last 5 minutes, prefer local
             # Otherwise, this is likely an older file, so prefer Obsidian
-            time_diff = current_time - local_mtime
+            time_diff = time.time() - local_mtime
             
             if time_diff < 300:  # 5 minutes
                 return local_content
@@ -59,10 +135,14 @@ class NewerWinsResolver(ConflictResolver):
             return local_content
 
 
+# Stateless resolvers shared as fallbacks by other strategies
+_NEWER_WINS_RESOLVER = NewerWinsResolver()
+
+
 class LocalWinsResolver(ConflictResolver):
     """Always prefer local content in conflicts"""
     
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """Always return local content"""
         return local_content
 
@@ -70,7 +150,7 @@ class LocalWinsResolver(ConflictResolver):
 class ObsidianWinsResolver(ConflictResolver):
     """Always prefer Obsidian content in conflicts"""
     
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """Always return Obsidian content"""
         return obsidian_content
 
@@ -78,45 +158,53 @@ class ObsidianWinsResolver(ConflictResolver):
 class MergeResolver(ConflictResolver):
     """Attempt to merge changes when possible"""
     
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """
         Attempt simple merge by combining unique lines
         Falls back to newer wins if merge is not possible
         """
+        if local_content == obsidian_content:
+            return local_content
+        
         try:
             local_lines = set(local_content.splitlines())
             obsidian_lines = set(obsidian_content.splitlines())
             
             # If one is a subset of the other, use the larger set
-            if local_lines.issubset(obsidian_lines):
-                return obsidian_content
+            # (a larger set can't be a subset, so only one check is needed)
+            if len(local_lines) <= len(obsidian_lines):
+                if local_lines.issubset(obsidian_lines):
+                    return obsidian_content
             elif obsidian_lines.issubset(local_lines):
                 return local_content
             
             # Otherwise, fall back to newer wins
-            fallback = NewerWinsResolver()
-            return fallback.resolve(local_content, obsidian_content, file_path)
+            return _NEWER_WINS_RESOLVER.resolve(local_content, obsidian_content, file_path)
             
         except Exception:
             # If merge fails, fall back to newer wins
-            fallback = NewerWinsResolver()
-            return fallback.resolve(local_content, obsidian_content, file_path)
+            return _NEWER_WINS_RESOLVER.resolve(local_content, obsidian_content, file_path)
+
+
+_MERGE_RESOLVER = MergeResolver()
 
 
 class InteractiveResolver(ConflictResolver):
     """Ask user to resolve conflicts interactively"""
     
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """Present conflict to user for manual resolution"""
-        print(f"\n🔥 CONFLICT DETECTED: {file_path}")
-        print("=" * 60)
-        print("LOCAL CONTENT:")
-        print("-" * 30)
-        print(local_content[:500] + ("..." if len(local_content) > 500 else ""))
-        print("\nOBSIDIAN CONTENT:")
-        print("-" * 30)
-        print(obsidian_content[:500] + ("..." if len(obsidian_content) > 500 else ""))
-        print("\n" + "=" * 60)
+        print(
+            f"\n🔥 CONFLICT DETECTED: {file_path}\n"
+            f"{_SEP60}\n"
+            f"LOCAL CONTENT:\n"
+            f"{_SEP30}\n"
+            f"{_preview(local_content)}\n"
+            f"\nOBSIDIAN CONTENT:\n"
+            f"{_SEP30}\n"
+            f"{_preview(obsidian_content)}\n"
+            f"\n{_SEP60}"
+        )
         
         while True:
             choice = input("Choose resolution [L]ocal / [O]bsidian / [M]erge / [E]dit: ").strip().lower()
@@ -127,8 +215,7 @@ class InteractiveResolver(ConflictResolver):
                 return obsidian_content
             elif choice == 'm':
                 # Attempt merge
-                merger = MergeResolver()
-                return merger.resolve(local_content, obsidian_content, file_path)
+                return _MERGE_RESOLVER.resolve(local_content, obsidian_content, file_path)
             elif choice == 'e':
                 # Open editor (simplified - would need proper editor integration)
                 print("📝 Please manually edit the file and press Enter when done.")
@@ -136,10 +223,8 @@ class InteractiveResolver(ConflictResolver):
                 
                 # Re-read local file if it exists
                 try:
-                    local_path = Path(file_path)
-                    if local_path.exists():
-                        with open(local_path, 'r', encoding='utf-8') as f:
-                            return f.read()
+                    data = _read_file_bytes(file_path)
+                    return data if isinstance(local_content, bytes) else data.decode('utf-8')
                 except Exception:
                     pass
                 
@@ -153,9 +238,17 @@ class BackupAndResolveResolver(ConflictResolver):
     
     def __init__(self, base_resolver: ConflictResolver):
         self.base_resolver = base_resolver
+        # Conflicts directories created in the current second, keyed by (parent, second)
+        self._dir_cache: Dict[Tuple[Path, int], Path] = {}
+        # Files may be synced from several worker threads at once
+        self._dir_lock = threading.Lock()
     
-    def resolve(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]) -> str:
+    def resolve(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]) -> NoteContent:
         """Create backup and then resolve using base resolver"""
+        # Identical content is not a real conflict - nothing to back up
+        if local_content is obsidian_content or local_content == obsidian_content:
+            return local_content
+        
         try:
             # Create conflict backup
             self._create_conflict_backup(local_content, obsidian_content, file_path)
@@ -165,48 +258,73 @@ class BackupAndResolveResolver(ConflictResolver):
         # Delegate to base resolver
         return self.base_resolver.resolve(local_content, obsidian_content, file_path)
     
-    def _create_conflict_backup(self, local_content: str, obsidian_content: str, file_path: Union[str, Path]):
+    def _create_conflict_backup(self, local_content: NoteContent, obsidian_content: NoteContent, file_path: Union[str, Path]):
         """Create backup files for both versions"""
-        file_path = Path(file_path)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+        parent = file_path.parent
+        stem = file_path.stem
+        suffix = file_path.suffix
+        sec = int(time.time())
         
-        # Create conflicts directory
-        conflicts_dir = file_path.parent / "conflicts" / timestamp
-        conflicts_dir.mkdir(parents=True, exist_ok=True)
+        # Create conflicts directory (shared by conflicts within the same second)
+        key = (parent, sec)
+        with self._dir_lock:
+            conflicts_dir = self._dir_cache.get(key)
+            if conflicts_dir is None:
+                if any(cached_sec != sec for _, cached_sec in self._dir_cache):
+                    self._dir_cache.clear()
+                conflicts_dir = parent / "conflicts" / _format_timestamp(sec)
+                conflicts_dir.mkdir(parents=True, exist_ok=True)
+                self._dir_cache[key] = conflicts_dir
         
         # Save both versions
-        local_backup = conflicts_dir / f"{file_path.stem}_local{file_path.suffix}"
-        obsidian_backup = conflicts_dir / f"{file_path.stem}_obsidian{file_path.suffix}"
+        local_backup = conflicts_dir / f"{stem}_local{suffix}"
+        obsidian_backup = conflicts_dir / f"{stem}_obsidian{suffix}"
         
-        with open(local_backup, 'w', encoding='utf-8') as f:
-            f.write(local_content)
-            
-        with open(obsidian_backup, 'w', encoding='utf-8') as f:
-            f.write(obsidian_content)
+        local_bytes = _to_bytes(local_content)
+        obsidian_bytes = _to_bytes(obsidian_content)
+        
+        if max(len(local_bytes), len(obsidian_bytes)) < _CONCURRENT_BACKUP_BYTES:
+            local_backup.write_bytes(local_bytes)
+            obsidian_backup.write_bytes(obsidian_bytes)
+        else:
+            # Large backups: overlap the two independent writes
+            future = _get_backup_pool().submit(obsidian_backup.write_bytes, obsidian_bytes)
+            local_backup.write_bytes(local_bytes)
+            future.result()
         
         print(f"📁 Conflict backup created in: {conflicts_dir}")
 
 
-def get_conflict_resolver(strategy: str) -> ConflictResolver:
+_RESOLVERS: Dict[str, Type[ConflictResolver]] = {
+    'newer_wins': NewerWinsResolver,
+    'local_wins': LocalWinsResolver,
+    'obsidian_wins': ObsidianWinsResolver,
+    'merge': MergeResolver,
+    'interactive': InteractiveResolver,
+}
+
+
+@lru_cache(maxsize=16)
+def get_conflict_resolver(strategy: str, create_backup: bool = True) -> ConflictResolver:
     """
     Factory function to get conflict resolver by strategy name
     
+    Resolvers are cached per (strategy, create_backup), so repeated calls
+    return the same instance.
+    
     Args:
         strategy: Strategy name ('newer_wins', 'local_wins', 'obsidian_wins', 'merge', 'interactive')
+        create_backup: Wrap the resolver to back up both versions before resolving
         
     Returns:
         ConflictResolver instance
     """
-    resolvers = {
-        'newer_wins': NewerWinsResolver,
-        'local_wins': LocalWinsResolver,
-        'obsidian_wins': ObsidianWinsResolver,
-        'merge': MergeResolver,
-        'interactive': InteractiveResolver,
-    }
+    resolver = _RESOLVERS.get(strategy, NewerWinsResolver)()
     
-    resolver_class = resolvers.get(strategy, NewerWinsResolver)
-    resolver = resolver_class()
+    if not create_backup:
+        return resolver
     
     # Wrap with backup resolver for safety
-    return BackupAndResolveResolver(resolver)
\ No newline at end of file
+    return BackupAndResolveResolver(resolver)
@@ -3,11 +3,137 @@
 Project initialization module for Obsidian sync
 """
 
+import os
+import re
+import json
+import mmap
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 import yaml
 
+# Prefer libyaml C bindings when PyYAML was built with them
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+# Placeholders substituted per project in the pre-rendered config template,
+# which is kept in sync with ProjectConfig._get_default_config()
+_VAULT_PLACEHOLDER = "__VAULT__"
+_NOTES_DIR_PLACEHOLDER = "__NOTES_DIR__"
+
+
+def _render_config_template() -> str:
+    """Render the project config file once with placeholder values"""
+    config = {
+        'obsidian': {
+            'vault_project_path': _VAULT_PLACEHOLDER,
+            'local_notes_dir': _NOTES_DIR_PLACEHOLDER
+        },
+        'sync': {
+            'interval_seconds': 30,
+            'min_interval_seconds': 10,
+            'max_interval_seconds': 300,
+            'conflict_resolution': 'newer_wins',
+            'create_backup': True,
+            'max_workers': 8,
+            'compress_uploads': False
+        },
+        'logging': {
+            'level': 'INFO',
+            'file': 'logs/obsidian_sync.log',
+            'max_file_size_mb': 10,
+            'backup_count': 5
+        },
+        'filters': {
+            'include_extensions': ['.md'],
+            'exclude_patterns': ['.*', '*.tmp', '*.bak']
+        },
+        'backup': {
+            'max_backups': 10,
+            'cleanup_old_backups': True,
+            'backup_before_sync': True
+        },
+        'notifications': {
+            'enable_slack': False,
+            'enable_discord': False,
+            'notify_on_success': False,
+            'notify_on_error': True
+        }
+    }
+    rendered: str = yaml.dump(config, Dumper=_YAML_DUMPER, default_flow_style=False,
+                              allow_unicode=True, sort_keys=False)
+    return rendered
+
+
+_CONFIG_TEMPLATE = _render_config_template()
+
+
+# Example project hub note; {NAME} is replaced with the project name
+_EXAMPLE_NOTE_TEMPLATE = b"""# {NAME}
+
+## Overview
+This is the main project hub for {NAME}.
+
+## Setup
+1. Configure Obsidian Local REST API plugin
+2. Copy `.env.example` to `.env` and configure API settings
+3. Run `make obsidian-test` to verify connection
+4. Run `make obsidian-sync` to start synchronization
+
+## Notes Structure
+- This notes/ folder syncs bidirectionally with Obsidian vault
+- Create new notes here or in Obsidian - they will sync automatically
+- Use Markdown format (.md files)
+
+## Quick Commands
+- `make obsidian-sync` - One-time sync
+- `make obsidian-watch` - Continuous monitoring
+- `make obsidian-test` - Test connection
+- `make obsidian-backup` - Create backup
+
+## Tags
+#project-hub #sync-enabled
+
+---
+*Created: today*
+*Auto-generated by obsidian-project-sync*
+"""
+
+
+# Any of our Makefile targets defined at the start of a line
+_MAKE_TARGETS_RE = re.compile(
+    rb"^obsidian-(?:sync|watch|test|setup|config|backup):", re.MULTILINE
+)
+
+
+def _file_matches(path: Path, pattern: "re.Pattern[bytes]") -> bool:
+    """Check if a file matches a bytes regex without decoding it"""
+    with open(path, 'rb') as f:
+        # Small files: one read beats mmap setup
+        if os.fstat(f.fileno()).st_size < 4096:
+            return pattern.search(f.read()) is not None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pattern.search(mm) is not None
+
+
+class _DirCache:
+    """Directory listing taken once with os.scandir for existence checks"""
+    
+    def __init__(self, parent: Path):
+        try:
+            self._entries: Dict[str, os.DirEntry] = {entry.name: entry for entry in os.scandir(parent)}
+        except FileNotFoundError:
+            self._entries = {}
+    
+    def exists(self, name: str) -> bool:
+        """Check if the directory contained an entry with this name"""
+        return name in self._entries
+    
+    def is_dir(self, name: str) -> bool:
+        """Check if the named entry is a directory, using the cached d_type"""
+        entry = self._entries.get(name)
+        return entry is not None and entry.is_dir()
+
 
 class ProjectInitializer:
     """Initialize Obsidian sync in a project"""
@@ -41,24 +167,28 @@ class ProjectInitializer:
             project_root = project_root or Path.cwd()
             project_name = project_name or project_root.name
             
+            # List project root once; helpers check existence against it
+            root_entries = _DirCache(project_root)
+            
             # Create configuration
             success = self._create_config_file(
-                project_root, project_name, vault_path, notes_dir, force
+                project_root, project_name, vault_path, notes_dir, force, root_entries
             )
             if not success:
                 return False
             
             # Create environment template
-            success = self._create_env_template(project_root, force)
+            success = self._create_env_template(project_root, force, root_entries)
             if not success:
                 return False
             
             # Create notes directory
             notes_path = project_root / notes_dir
-            notes_path.mkdir(exist_ok=True)
+            if not root_entries.is_dir(notes_dir):
+                notes_path.mkdir(exist_ok=True)
             
             # Add Makefile targets
-            self._add_makefile_targets(project_root, force)
+            self._add_makefile_targets(project_root, force, root_entries)
             
             # Create example note
             self._create_example_note(notes_path, project_name)
@@ -80,13 +210,14 @@ class ProjectInitializer:
         project_name: str,
         vault_path: Optional[str],
         notes_dir: str,
-        force: bool
+        force: bool,
+        root_entries: _DirCache
     ) -> bool:
         """Create configuration file"""
         config_dir = project_root / "config"
         config_file = config_dir / "obsidian-sync.yml"
         
-        if config_file.exists() and not force:
+        if not force and root_entries.is_dir("config") and config_file.exists():
             print(f"⚠️ Configuration already exists: {config_file}")
             print("Use --force to overwrite")
             return False
@@ -94,52 +225,25 @@ class ProjectInitializer:
         # Create configuration
         vault_project_path = vault_path or f"10-Projects/{project_name}"
         
-        config = {
-            'obsidian': {
-                'vault_project_path': vault_project_path,
-                'local_notes_dir': notes_dir
-            },
-            'sync': {
-                'interval_seconds': 30,
-                'conflict_resolution': 'newer_wins',
-                'create_backup': True
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': 'logs/obsidian_sync.log',
-                'max_file_size_mb': 10,
-                'backup_count': 5
-            },
-            'filters': {
-                'include_extensions': ['.md'],
-                'exclude_patterns': ['.*', '*.tmp', '*.bak']
-            },
-            'backup': {
-                'max_backups': 10,
-                'cleanup_old_backups': True,
-                'backup_before_sync': True
-            },
-            'notifications': {
-                'enable_slack': False,
-                'enable_discord': False,
-                'notify_on_success': False,
-                'notify_on_error': True
-            }
-        }
-        
         # Create config directory and file
         config_dir.mkdir(exist_ok=True)
-        with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        rendered = (
+            _CONFIG_TEMPLATE
+            .replace(_VAULT_PLACEHOLDER, json.dumps(vault_project_path, ensure_ascii=False))
+            .replace(_NOTES_DIR_PLACEHOLDER, json.dumps(notes_dir, ensure_ascii=False))
+        )
+        config_file.write_bytes(rendered.encode('utf-8'))
         
         print(f"📄 Created configuration: {config_file}")
         return True
     
-    def _create_env_template(self, project_root: Path, force: bool) -> bool:
+    def _create_env_template(
+        self, project_root: Path, force: bool, root_entries: _DirCache
+    ) -> bool:
         """Create .env.example file"""
         env_example = project_root / ".env.example"
         
-        if env_example.exists() and not force:
+        if root_entries.exists(".env.example") and not force:
             print(f"⚠️ Environment template already exists: {env_example}")
             return True
         
@@ -159,13 +263,14 @@ OBSIDIAN_API_KEY=your-api-key-here
 # LOG_LEVEL=DEBUG
 """
         
-        with open(env_example, 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        env_example.write_bytes(env_content.encode('utf-8'))
         
         print(f"📄 Created environment template: {env_example}")
         return True
     
-    def _add_makefile_targets(self, project_root: Path, force: bool):
+    def _add_makefile_targets(
+        self, project_root: Path, force: bool, root_entries: _DirCache
+    ):
         """Add Makefile targets for Obsidian sync"""
         makefile = project_root / "Makefile"
         
@@ -198,18 +303,15 @@ obsidian-backup:
 	@obsidian-sync backup
 """
         
-        if makefile.exists():
+        if root_entries.exists("Makefile"):
             # Check if targets already exist
-            with open(makefile, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if "obsidian-sync:" in content and not force:
+            if not force and _file_matches(makefile, _MAKE_TARGETS_RE):
                 print("⚠️ Makefile targets already exist")
                 return
             
             # Append targets
-            with open(makefile, 'a', encoding='utf-8') as f:
-                f.write(targets)
+            with open(makefile, 'ab') as f:
+                f.write(targets.encode('utf-8'))
             print("📄 Added Makefile targets")
         else:
             # Create new Makefile
@@ -226,8 +328,7 @@ help:
 	@echo "  obsidian-backup - Create manual backup"
 {targets}"""
             
-            with open(makefile, 'w', encoding='utf-8') as f:
-                f.write(makefile_content)
+            makefile.write_bytes(makefile_content.encode('utf-8'))
             print(f"📄 Created Makefile: {makefile}")
     
     def _create_example_note(self, notes_dir: Path, project_name: str):
@@ -237,38 +338,8 @@ help:
         if example_note.exists():
             return
         
-        content = f"""# {project_name}
-
-## Overview
-This is the main project hub for {project_name}.
-
-## Setup
-1. Configure Obsidian Local REST API plugin
-2. Copy `.env.example` to `.env` and configure API settings
-3. Run `make obsidian-test` to verify connection
-4. Run `make obsidian-sync` to start synchronization
-
-## Notes Structure
-- This notes/ folder syncs bidirectionally with Obsidian vault
-- Create new notes here or in Obsidian - they will sync automatically
-- Use Markdown format (.md files)
-
-## Quick Commands
-- `make obsidian-sync` - One-time sync
-- `make obsidian-watch` - Continuous monitoring
-- `make obsidian-test` - Test connection
-- `make obsidian-backup` - Create backup
-
-## Tags
-#project-hub #sync-enabled
-
----
-*Created: {yaml.safe_load("!!timestamp")or "today"}*
-*Auto-generated by obsidian-project-sync*
-"""
-        
-        with open(example_note, 'w', encoding='utf-8') as f:
-            f.write(content)
+        name = project_name.encode('utf-8')
+        example_note.write_bytes(_EXAMPLE_NOTE_TEMPLATE.replace(b"{NAME}", name))
         
         print(f"📝 Created example note: {example_note}")
 
@@ -4,20 +4,86 @@ Obsidian Local REST API synchronization manager
 Bidirectional synchronization between notes/ folder and Obsidian vault
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import json
+import functools
+import gzip
 from pathlib import Path
-from datetime import datetime
 import hashlib
 import time
 import shutil
-from typing import Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
 import logging
-import fnmatch
 
-from .config import ProjectConfig
-from .conflict_resolver import ConflictResolver, get_conflict_resolver
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from .config import ProjectConfig, _atomic_write_bytes
+from .conflict_resolver import ConflictResolver, _to_bytes, get_conflict_resolver
+
+# Sidecar file in the notes folder recording each note's content hash (and the
+# local file's mtime and size) at its last sync
+_SYNC_CACHE_FILE = ".sync_cache.json"
+_SYNC_CACHE_VERSION = 2
+
+# Local notes at least this large are hashed in chunks instead of being read in
+_STREAM_HASH_MIN_BYTES = 256 * 1024
+_HASH_CHUNK_BYTES = 64 * 1024
+
+# Content hashes only test equality, so prefer the much faster non-cryptographic xxh3
+_HASH_ALGORITHM = "xxh3_64" if xxhash is not None else "md5"
+
+# Most recently fetched vault notes kept for conditional GETs
+_ETAG_CACHE_SIZE = 256
+
+# Request headers for note bodies sent as plain text
+_TEXT_HEADERS = {"Content-Type": "text/plain; charset=utf-8"}
+_GZIP_TEXT_HEADERS = {"Content-Type": "text/plain; charset=utf-8", "Content-Encoding": "gzip"}
+
+# With sync.compress_uploads, note bodies at least this large are gzipped
+_GZIP_MIN_BYTES = 4 * 1024
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when installed (its decode errors are ValueErrors too)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """Copy a file with its metadata, moving the data in the kernel when possible"""
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    try:
+        if copy_file_range is None:
+            raise OSError("copy_file_range not available")
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    raise OSError("copy_file_range stopped early")
+                remaining -= copied
+    except OSError:
+        # Unsupported platform or filesystem: shutil's own copy
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
 
 
 class ObsidianSyncManager:
@@ -42,13 +108,40 @@ class ObsidianSyncManager:
         self.local_notes_dir = self.config.local_notes_dir
         
         # Conflict resolver
-        self.conflict_resolver = get_conflict_resolver(self.config.conflict_resolution)
+        self.conflict_resolver = get_conflict_resolver(
+            self.config.conflict_resolution, create_backup=self.config.create_backup
+        )
+        
+        # Worker pool for per-file sync, created on first use and reused across syncs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Content hash and local stat of each note when both sides last matched,
+        # keyed by file name
+        self._sync_cache_file = self.local_notes_dir / _SYNC_CACHE_FILE
+        self._sync_cache: Dict[str, Dict[str, Any]] = self._load_sync_cache()
+        
+        # Notes Local → Obsidian just left identical on both sides; the following
+        # Obsidian → Local pass trusts these instead of fetching them again
+        self._confirmed_notes: set = set()
+        
+        # Last ETag and content seen per vault note, for conditional GETs across syncs
+        # (LRU, bounded; notes missing from a vault listing are dropped)
+        self._etag_cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
         
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         
+        # Gzip large uploads (responses are already negotiated with Accept-Encoding
+        # by requests and decompressed transparently)
+        self._compress_uploads = self.config.sync_compress_uploads
+        
+        # Pooled connections to the Obsidian API, reused across requests and syncs
+        self._base_url = self.api_host
+        self.session = self._create_session()
+        
         # Disable SSL warnings for local development
         requests.packages.urllib3.disable_warnings()
         
@@ -60,22 +153,58 @@ class ObsidianSyncManager:
         self.logger.info(f"Vault Path: {self.vault_path}")
         self.logger.info(f"Local Notes: {self.local_notes_dir}")
         
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """API request helper function"""
-        url = f"{self.api_host}{endpoint}"
-        kwargs.setdefault('headers', self.headers)
-        kwargs.setdefault('verify', False)  # For local HTTPS
-        kwargs.setdefault('timeout', 30)  # 30 second timeout
-        
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session used for all Obsidian API requests"""
+        session = requests.Session()
+        # One host; keep a connection per sync worker and retry transient gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(1, self.config.sync_max_workers),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.headers)
+        session.verify = False
+        return session
+    
+    def __enter__(self) -> "ObsidianSyncManager":
+        return self
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+    
+    # verify is passed per request: a CA bundle from the environment would override session.verify
+    def _get(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """GET an API endpoint"""
+        return self._send("GET", endpoint, headers=headers, verify=False, timeout=30)
+    
+    def _put(self, endpoint: str, data: bytes, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """PUT a request body to an API endpoint"""
+        return self._send("PUT", endpoint, data=data, headers=headers, verify=False, timeout=30)
+    
+    def _delete(self, endpoint: str) -> requests.Response:
+        """DELETE an API endpoint"""
+        return self._send("DELETE", endpoint, verify=False, timeout=30)
+    
+    def _send(self, method: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        """Send a request to the API, logging failures and raising HTTP errors"""
         try:
-            self.logger.debug(f"API request: {method} {endpoint}")
-            response = requests.request(method, url, **kwargs)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("API request: %s %s", method, endpoint)
+            response = self.session.request(method, self._base_url + endpoint, **kwargs)
             response.raise_for_status()
             return response
         except requests.HTTPError as e:
             # 404 errors are expected when checking for non-existent files
             if e.response.status_code == 404 and method == "GET":
-                self.logger.debug(f"API request {method} {endpoint}: {e} (expected for non-existent files)")
+                self.logger.debug("API request %s %s: %s (expected for non-existent files)", method, endpoint, e)
             else:
                 self.logger.error(f"API request failed {method} {endpoint}: {e}")
             raise
@@ -83,10 +212,28 @@ class ObsidianSyncManager:
             self.logger.error(f"API request failed {method} {endpoint}: {e}")
             raise
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool used to sync files in parallel"""
+        if self._executor is None:
+            # Interactive resolution prompts on the terminal, so resolve one file at a time
+            if self.config.conflict_resolution == 'interactive':
+                max_workers = 1
+            else:
+                max_workers = max(1, self.config.sync_max_workers)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="obsidian-sync")
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the sync worker pool and close pooled API connections"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
     def test_connection(self) -> bool:
         """Test API connection"""
         try:
-            response = self._make_request("GET", "/")
+            response = self._get("/")
             self.logger.info("✅ Obsidian API connection successful")
             return True
         except Exception as e:
@@ -97,18 +244,21 @@ class ObsidianSyncManager:
         """Get notes list from Obsidian vault"""
         try:
             # Query project folder directly
-            response = self._make_request("GET", f"/vault/{self.vault_path}/")
+            response = self._get(f"/vault/{self.vault_path}/")
             
-            # Log response details
-            self.logger.debug(f"API response status: {response.status_code}")
-            self.logger.debug(f"API response headers: {response.headers}")
-            self.logger.debug(f"API response content (first 500 chars): {response.text[:500]}")
+            # Log response details (only built when DEBUG is enabled)
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("API response status: %s", response.status_code)
+                self.logger.debug("API response headers: %s", response.headers)
+                self.logger.debug("API response content (first 500 chars): %s", response.text[:500])
             
             # Parse JSON response
             try:
-                response_data = response.json()
-                self.logger.debug(f"JSON parsing successful, type: {type(response_data)}")
-                self.logger.debug(f"JSON keys: {list(response_data.keys()) if isinstance(response_data, dict) else 'not a dict'}")
+                response_data = _json_loads(response.content)
+                if debug:
+                    self.logger.debug("JSON parsing successful, type: %s", type(response_data))
+                    self.logger.debug("JSON keys: %s", list(response_data.keys()) if isinstance(response_data, dict) else 'not a dict')
             except ValueError as e:
                 self.logger.error(f"JSON parsing failed: {e}")
                 self.logger.error(f"Response content: {response.text}")
@@ -127,11 +277,12 @@ class ObsidianSyncManager:
                 return []
                 
             files = response_data.get("files", [])
-            self.logger.debug(f"Total {len(files)} files found")
-            
-            # Log first few files for debugging
-            for i, file_item in enumerate(files[:5]):
-                self.logger.debug(f"File {i+1}: {file_item}")
+            if debug:
+                self.logger.debug("Total %d files found", len(files))
+                
+                # Log first few files for debugging
+                for i, file_item in enumerate(files[:5]):
+                    self.logger.debug("File %d: %s", i + 1, file_item)
             
             # Filter .md files and convert to full paths
             project_notes = []
@@ -149,8 +300,15 @@ class ObsidianSyncManager:
                             file_path = f"{self.vault_path}/{file_path}"
                         project_notes.append({"path": file_path, "name": file_item.get("name", file_path.split("/")[-1])})
             
+            # Forget cached bodies of notes no longer in the vault
+            listed = {note["path"] for note in project_notes}
+            with self._etag_lock:
+                for note_path in [path for path in self._etag_cache if path not in listed]:
+                    del self._etag_cache[note_path]
+            
             self.logger.info(f"Total {len(files)} files, {len(project_notes)} project notes found")
-            self.logger.debug(f"Project notes: {[note.get('path', 'no path') for note in project_notes]}")
+            if debug:
+                self.logger.debug("Project notes: %s", [note.get('path', 'no path') for note in project_notes])
             
             return project_notes
         except Exception as e:
@@ -160,21 +318,31 @@ class ObsidianSyncManager:
     def _should_include_file(self, file_path: str) -> bool:
         """Check if file should be included based on filters"""
         # Check extension
-        if not any(file_path.endswith(ext) for ext in self.config.include_extensions):
+        if not self.config.has_included_extension(file_path):
             return False
         
-        # Check exclude patterns
-        file_name = Path(file_path).name
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(file_name, pattern):
-                return False
-                
-        return True
+        # Check exclude patterns against the base name (vault paths always use '/')
+        return not self.config.is_excluded(file_path.rsplit("/", 1)[-1])
 
     def get_note_content(self, note_path: str) -> Optional[str]:
         """Get specific note content"""
+        content = self._get_note_bytes(note_path)
+        return content.decode('utf-8', errors='replace') if content is not None else None
+
+    def _get_note_bytes(self, note_path: str) -> Optional[bytes]:
+        """Get specific note content as raw UTF-8 bytes"""
         try:
-            response = self._make_request("GET", f"/vault/{note_path}")
+            # Revalidate a previously seen note instead of downloading it again
+            with self._etag_lock:
+                cached = self._etag_cache.get(note_path)
+                if cached:
+                    self._etag_cache.move_to_end(note_path)
+            headers = {"If-None-Match": cached[0]} if cached else None
+            response = self._get(f"/vault/{note_path}", headers=headers)
+            
+            if response.status_code == 304 and cached:
+                self.logger.debug("Note not modified: %s", note_path)
+                return cached[1]
             
             # Check response content type
             content_type = response.headers.get('content-type', '').lower()
@@ -182,9 +350,9 @@ class ObsidianSyncManager:
             # Handle JSON response
             if 'application/json' in content_type:
                 try:
-                    response_data = response.json()
+                    response_data = _json_loads(response.content)
                     if isinstance(response_data, dict):
-                        content = response_data.get("content", "")
+                        content = response_data.get("content", "").encode('utf-8')
                     else:
                         self.logger.error(f"Unexpected JSON response format ({note_path}): {type(response_data)}")
                         return None
@@ -193,13 +361,25 @@ class ObsidianSyncManager:
                     return None
             # Handle text response (Obsidian API returns content directly)
             else:
-                content = response.text
+                content = response.content
+            
+            etag = response.headers.get('ETag')
+            with self._etag_lock:
+                if etag:
+                    self._etag_cache[note_path] = (etag, content)
+                    self._etag_cache.move_to_end(note_path)
+                    if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+                else:
+                    self._etag_cache.pop(note_path, None)
             
-            self.logger.debug(f"Note content retrieved successfully: {note_path}")
+            self.logger.debug("Note content retrieved successfully: %s", note_path)
             return content
         except requests.HTTPError as e:
+            with self._etag_lock:
+                self._etag_cache.pop(note_path, None)
             if e.response.status_code == 404:
-                self.logger.debug(f"Note not found in vault {note_path}: {e} (this is normal for new files)")
+                self.logger.debug("Note not found in vault %s: %s (this is normal for new files)", note_path, e)
             else:
                 self.logger.error(f"Failed to get note content {note_path}: {e}")
             return None
@@ -207,7 +387,7 @@ class ObsidianSyncManager:
             self.logger.error(f"Failed to get note content {note_path}: {e}")
             return None
 
-    def create_or_update_note(self, note_path: str, content: str) -> bool:
+    def create_or_update_note(self, note_path: str, content: Union[str, bytes]) -> bool:
         """Create or update note"""
         if self.dry_run:
             self.logger.info(f"DRY RUN: Would update note: {note_path}")
@@ -215,23 +395,22 @@ class ObsidianSyncManager:
             
         try:
             # Send text directly in body
-            url = f"{self.api_host}/vault/{note_path}"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "text/plain; charset=utf-8"
-            }
-            
-            response = requests.put(url, data=content.encode('utf-8'), 
-                                  headers=headers, verify=False, timeout=30)
+            data = content if isinstance(content, bytes) else content.encode('utf-8')
+            headers = _TEXT_HEADERS
+            if self._compress_uploads and len(data) >= _GZIP_MIN_BYTES:
+                # Markdown compresses well; level 1 keeps the CPU cost low
+                data = gzip.compress(data, compresslevel=1)
+                headers = _GZIP_TEXT_HEADERS
+            response = self._put(f"/vault/{note_path}", data, headers=headers)
             
             # Handle success status codes: 200, 201, 204
             success = response.status_code in [200, 201, 204]
             
             if success:
-                self.logger.debug(f"Note update successful: {note_path} (Status: {response.status_code})")
+                self.logger.debug("Note update successful: %s (Status: %s)", note_path, response.status_code)
             else:
                 self.logger.warning(f"Note update failed: {note_path} (Status: {response.status_code})")
-                self.logger.debug(f"Response content: {response.text}")
+                self.logger.debug("Response content: %s", response.text)
             
             return success
         except Exception as e:
@@ -245,7 +424,7 @@ class ObsidianSyncManager:
             return True
             
         try:
-            response = self._make_request("DELETE", f"/vault/{note_path}")
+            response = self._delete(f"/vault/{note_path}")
             success = response.status_code == 200
             
             if success:
@@ -264,12 +443,12 @@ class ObsidianSyncManager:
             return None
             
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             backup_dir = self.config.project_root / "notes_backup" / timestamp
             
             if self.local_notes_dir.exists():
                 if not self.dry_run:
-                    shutil.copytree(self.local_notes_dir, backup_dir)
+                    shutil.copytree(self.local_notes_dir, backup_dir, copy_function=_fast_copy)
                 self.logger.info(f"Backup created: {backup_dir}")
                 return backup_dir
             else:
@@ -280,30 +459,128 @@ class ObsidianSyncManager:
             self.logger.error(f"Backup creation failed: {e}")
             return None
 
-    def cleanup_old_backups(self, max_backups: Optional[int] = None):
+    def cleanup_old_backups(self, max_backups: Optional[int] = None) -> None:
         """Clean up old backup files"""
         max_backups = max_backups or self.config.max_backups
         
         backup_root = self.config.project_root / "notes_backup"
-        if not backup_root.exists():
+        try:
+            with os.scandir(backup_root) as it:
+                backup_dirs = [entry for entry in it if entry.is_dir()]
+        except FileNotFoundError:
             return
-            
-        # Get all backup directories sorted by modification time
-        backup_dirs = [d for d in backup_root.iterdir() if d.is_dir()]
-        backup_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        
+        # Backup names are YYYYMMDD_HHMMSS timestamps, so name order is age order
+        backup_dirs.sort(key=lambda x: x.name, reverse=True)
         
         # Remove old backups
         for old_backup in backup_dirs[max_backups:]:
             try:
                 if not self.dry_run:
-                    shutil.rmtree(old_backup)
+                    shutil.rmtree(old_backup.path)
                 self.logger.info(f"Removed old backup: {old_backup.name}")
             except Exception as e:
-                self.logger.error(f"Failed to remove old backup {old_backup}: {e}")
+                self.logger.error(f"Failed to remove old backup {old_backup.path}: {e}")
 
     def get_file_hash(self, content: str) -> str:
-        """Calculate file content hash"""
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        """Calculate file content hash (xxh3_64 if xxhash is installed, else MD5)"""
+        return self._hash_bytes(content.encode('utf-8'))
+
+    def _hash_bytes(self, data: bytes) -> str:
+        """Calculate content hash of raw bytes (or any bytes-like buffer)"""
+        if xxhash is not None:
+            return xxhash.xxh3_64_hexdigest(data)
+        return hashlib.md5(data).hexdigest()
+
+    def _load_sync_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load last-synced note state from the notes folder"""
+        try:
+            with open(self._sync_cache_file, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable sync cache {self._sync_cache_file}: {e}")
+            return {}
+        
+        # Hashes from another algorithm (xxhash installed or removed) can't be compared
+        if (not isinstance(data, dict) or data.get("version") != _SYNC_CACHE_VERSION
+                or data.get("hash_algorithm") != _HASH_ALGORITHM):
+            return {}
+        files: Dict[str, Dict[str, Any]] = data.get("files", {})
+        return files
+    
+    def _save_sync_cache(self) -> None:
+        """Save last-synced note state to the notes folder"""
+        if self.dry_run or not self.local_notes_dir.exists():
+            return
+        
+        data = {
+            "version": _SYNC_CACHE_VERSION,
+            "hash_algorithm": _HASH_ALGORITHM,
+            "files": dict(sorted(self._sync_cache.items())),
+        }
+        try:
+            self._sync_cache_file.write_bytes(json.dumps(data, indent=1).encode('utf-8'))
+        except OSError as e:
+            self.logger.warning(f"Failed to save sync cache {self._sync_cache_file}: {e}")
+    
+    def _cached_hash(self, name: str, st: os.stat_result) -> Optional[str]:
+        """Get a note's last-synced hash if its local file is unchanged since then"""
+        entry = self._sync_cache.get(name)
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return cast(str, entry["hash"])
+        return None
+    
+    def _mark_synced(self, name: str, content_hash: str, local_file: Path,
+                     st: Optional[os.stat_result] = None) -> None:
+        """Record that local and vault copies of a note hold identical content"""
+        if self.dry_run:
+            return
+        try:
+            st = st or os.stat(local_file)
+        except OSError:
+            self._sync_cache.pop(name, None)
+            return
+        self._sync_cache[name] = {"hash": content_hash, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    
+    def _read_local(self, local_file: Path) -> Tuple[bytes, os.stat_result]:
+        """Read a local note's bytes along with the stat of the file that was read"""
+        with open(local_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            return f.read(), st
+    
+    def _hash_local(self, local_file: Path) -> Tuple[Optional[bytes], str, os.stat_result]:
+        """
+        Hash a local note, reading it into memory only if it is small
+        
+        Returns:
+            Tuple of (content, or None for large files hashed in chunks; hash; stat)
+        """
+        with open(local_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if st.st_size < _STREAM_HASH_MIN_BYTES:
+                content = f.read()
+                return content, self._hash_bytes(content), st
+            # Large file: hash through one reusable buffer (unlike mmap, a file
+            # truncated meanwhile just hashes short instead of raising SIGBUS)
+            hasher: Any = xxhash.xxh3_64() if xxhash is not None else hashlib.md5()
+            buf = bytearray(_HASH_CHUNK_BYTES)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+            return None, hasher.hexdigest(), st
+    
+    def _reread_local(self, local_file: Path, local_hash: str,
+                      st: os.stat_result) -> Tuple[bytes, str, os.stat_result]:
+        """Read a note hashed by _hash_local, rehashing only if it changed in between"""
+        content, new_st = self._read_local(local_file)
+        if (new_st.st_mtime_ns, new_st.st_size) != (st.st_mtime_ns, st.st_size):
+            local_hash = self._hash_bytes(content)
+        return content, local_hash, new_st
 
     def sync_local_to_obsidian(self) -> Dict[str, int]:
         """Sync local notes/ → Obsidian vault"""
@@ -313,54 +590,98 @@ class ObsidianSyncManager:
             self.logger.warning(f"Local notes directory not found: {self.local_notes_dir}")
             return stats
         
-        # Get all matching files
-        all_files = []
-        for ext in self.config.include_extensions:
-            all_files.extend(self.local_notes_dir.glob(f"*{ext}"))
+        self._confirmed_notes = set()
         
-        # Filter files
-        md_files = [f for f in all_files if self._should_include_file(f.name)]
+        # Get all matching files (single directory scan, filtered in place)
+        md_files = [Path(entry.path) for entry in self.config.iter_local_notes()]
         self.logger.info(f"Found {len(md_files)} local files to sync")
         
-        for local_file in md_files:
-            try:
-                # Read local file
-                with open(local_file, 'r', encoding='utf-8') as f:
-                    local_content = f.read()
-                
-                # Construct Obsidian vault path
-                vault_note_path = f"{self.vault_path}/{local_file.name}"
+        # One vault listing tells which notes exist remotely; an empty or failed
+        # listing falls back to checking each note individually
+        remote_names = {note["path"].rsplit("/", 1)[-1] for note in self.get_vault_notes()} or None
+        
+        sync_one = functools.partial(self._sync_one_local, remote_names=remote_names)
+        for tag in self._get_executor().map(sync_one, md_files):
+            stats[tag] += 1
+        
+        # Forget notes that no longer exist locally
+        local_names = {local_file.name for local_file in md_files}
+        for name in self._sync_cache.keys() - local_names:
+            del self._sync_cache[name]
+        self._save_sync_cache()
                 
+        return stats
+
+    def _sync_one_local(self, local_file: Path, remote_names: Optional[set] = None) -> str:
+        """Sync a single local file to Obsidian and return its stats key"""
+        try:
+            name = local_file.name
+            listed = remote_names is not None and name in remote_names
+            
+            # Unchanged locally since the last sync (same mtime and size): skip
+            # without reading; vault-side edits are picked up by Obsidian → Local
+            if listed and self._cached_hash(name, os.stat(local_file)) is not None:
+                self.logger.debug("⏭️ Skipped: %s (unchanged since last sync)", name)
+                return "skipped"
+            
+            # Hash local file (large files are hashed without reading them in)
+            local_content, local_hash, st = self._hash_local(local_file)
+            
+            # Construct Obsidian vault path
+            vault_note_path = f"{self.vault_path}/{name}"
+            
+            if remote_names is None:
+                # No listing: check current content in Obsidian
+                current_content = self._get_note_bytes(vault_note_path)
+            elif not listed:
+                # Not in the vault listing: create without fetching
+                current_content = None
+            elif self._sync_cache.get(name, {}).get("hash") == local_hash:
+                # Touched but content unchanged since the last sync
+                self._mark_synced(name, local_hash, local_file, st)
+                self.logger.debug("⏭️ Skipped: %s (unchanged since last sync)", name)
+                return "skipped"
+            else:
                 # Check current content in Obsidian
-                current_content = self.get_note_content(vault_note_path)
-                
-                if current_content is None:
-                    # Create new note
-                    if self.create_or_update_note(vault_note_path, local_content):
-                        stats["created"] += 1
-                        self.logger.info(f"✅ Created: {local_file.name}")
-                    else:
-                        stats["errors"] += 1
-                elif self.get_file_hash(current_content) != self.get_file_hash(local_content):
-                    # Handle conflict
-                    resolved_content = self.conflict_resolver.resolve(
-                        local_content, current_content, local_file
-                    )
-                    
-                    if self.create_or_update_note(vault_note_path, resolved_content):
-                        stats["updated"] += 1
-                        self.logger.info(f"🔄 Updated: {local_file.name}")
-                    else:
-                        stats["errors"] += 1
-                else:
-                    stats["skipped"] += 1
-                    self.logger.debug(f"⏭️ Skipped: {local_file.name} (no changes)")
-                    
-            except Exception as e:
-                self.logger.error(f"❌ Error with {local_file.name}: {e}")
-                stats["errors"] += 1
+                current_content = self._get_note_bytes(vault_note_path)
+            
+            # Different lengths can't be equal, so only ties are hashed
+            if (current_content is not None and len(current_content) == st.st_size
+                    and self._hash_bytes(current_content) == local_hash):
+                self._mark_synced(name, local_hash, local_file, st)
+                self._confirmed_notes.add(name)
+                self.logger.debug("⏭️ Skipped: %s (no changes)", name)
+                return "skipped"
+            
+            # Content is needed from here on
+            if local_content is None:
+                local_content, local_hash, st = self._reread_local(local_file, local_hash, st)
+            
+            if current_content is None:
+                # Create new note
+                if self.create_or_update_note(vault_note_path, local_content):
+                    self._mark_synced(name, local_hash, local_file, st)
+                    self._confirmed_notes.add(name)
+                    self.logger.info(f"✅ Created: {name}")
+                    return "created"
+                return "errors"
+            
+            # Handle conflict
+            resolved_content = self.conflict_resolver.resolve(
+                local_content, current_content, local_file
+            )
+            
+            if self.create_or_update_note(vault_note_path, resolved_content):
+                if resolved_content == local_content:
+                    self._mark_synced(name, local_hash, local_file, st)
+                    self._confirmed_notes.add(name)
+                self.logger.info(f"🔄 Updated: {name}")
+                return "updated"
+            return "errors"
                 
-        return stats
+        except Exception as e:
+            self.logger.error(f"❌ Error with {local_file.name}: {e}")
+            return "errors"
 
     def sync_obsidian_to_local(self) -> Dict[str, int]:
         """Sync Obsidian vault → local notes/"""
@@ -373,56 +694,108 @@ class ObsidianSyncManager:
         # Get project notes from Obsidian vault
         vault_notes = self.get_vault_notes()
         
-        for note in vault_notes:
-            try:
-                note_path = note.get("path", "")
-                note_name = Path(note_path).name
+        # List the local folder once instead of probing each note's path
+        try:
+            with os.scandir(self.local_notes_dir) as it:
+                local_entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            local_entries = {}
+        
+        sync_one = functools.partial(self._sync_one_remote, local_entries=local_entries)
+        for tag in self._get_executor().map(sync_one, vault_notes):
+            if tag is not None:
+                stats[tag] += 1
+        
+        self._confirmed_notes = set()
+        self._save_sync_cache()
                 
-                # Skip non-matching files
-                if not self._should_include_file(note_name):
-                    continue
-                    
-                local_file_path = self.local_notes_dir / note_name
+        return stats
+
+    def _sync_one_remote(self, note: Dict,
+                         local_entries: Optional[Dict[str, os.DirEntry]] = None) -> Optional[str]:
+        """Sync a single vault note to the local folder and return its stats key"""
+        try:
+            note_path = note.get("path", "")
+            note_name = note_path.rsplit("/", 1)[-1]
+            
+            # Skip non-matching files
+            if not self._should_include_file(note_name):
+                return None
                 
-                # Get note content from Obsidian
-                vault_content = self.get_note_content(note_path)
-                if vault_content is None:
-                    continue
+            local_file_path = self.local_notes_dir / note_name
+            
+            # Check local file (DirEntry.stat() is cached per entry)
+            local_st: Optional[os.stat_result]
+            try:
+                if local_entries is None:
+                    local_st = os.stat(local_file_path)
+                else:
+                    entry = local_entries.get(note_name)
+                    local_st = entry.stat() if entry is not None else None
+            except FileNotFoundError:
+                local_st = None
+            
+            # Just uploaded or verified by Local → Obsidian, and untouched since
+            if (note_name in self._confirmed_notes and local_st is not None
+                    and self._cached_hash(note_name, local_st) is not None):
+                self.logger.debug("⏭️ Skipped: %s (synced in this pass)", note_name)
+                return "skipped"
+            
+            # Get note content from Obsidian
+            vault_content = self._get_note_bytes(note_path)
+            if vault_content is None:
+                return None
+            
+            vault_hash = self._hash_bytes(vault_content)
+            
+            if local_st is not None:
+                # Local file unchanged since a sync that matched this vault content
+                if self._cached_hash(note_name, local_st) == vault_hash:
+                    self.logger.debug("⏭️ Skipped: %s (no changes)", note_name)
+                    return "skipped"
                 
-                # Check local file
-                if local_file_path.exists():
-                    with open(local_file_path, 'r', encoding='utf-8') as f:
-                        local_content = f.read()
-                    
-                    if self.get_file_hash(local_content) != self.get_file_hash(vault_content):
-                        # Handle conflict
-                        resolved_content = self.conflict_resolver.resolve(
-                            local_content, vault_content, local_file_path
-                        )
-                        
-                        if not self.dry_run:
-                            with open(local_file_path, 'w', encoding='utf-8') as f:
-                                f.write(resolved_content)
-                        stats["updated"] += 1
-                        self.logger.info(f"🔄 Updated: {note_name}")
-                    else:
-                        stats["skipped"] += 1
-                        self.logger.debug(f"⏭️ Skipped: {note_name} (no changes)")
+                # Different lengths can't be equal, so only ties are hashed
+                # (large files in chunks, without reading them in)
+                if local_st.st_size == len(vault_content):
+                    local_content, local_hash, st = self._hash_local(local_file_path)
+                    if st.st_size == len(vault_content) and local_hash == vault_hash:
+                        self._mark_synced(note_name, vault_hash, local_file_path, st)
+                        self.logger.debug("⏭️ Skipped: %s (no changes)", note_name)
+                        return "skipped"
+                    if local_content is None:
+                        local_content, st = self._read_local(local_file_path)
                 else:
-                    # Create new file
-                    if not self.dry_run:
-                        with open(local_file_path, 'w', encoding='utf-8') as f:
-                            f.write(vault_content)
-                    stats["created"] += 1
-                    self.logger.info(f"✅ Created: {note_name}")
-                    
-            except Exception as e:
-                self.logger.error(f"❌ Error with {note.get('path', 'unknown')}: {e}")
-                stats["errors"] += 1
+                    local_content, st = self._read_local(local_file_path)
                 
-        return stats
+                # Handle conflict (resolvers return bytes for bytes input)
+                resolved_content = _to_bytes(self.conflict_resolver.resolve(
+                    local_content, vault_content, local_file_path
+                ))
+                
+                if not self.dry_run:
+                    _atomic_write_bytes(local_file_path, resolved_content, fsync=False)
+                
+                # Local → Obsidian skips notes unchanged since the last sync,
+                # so push a resolution that kept local edits here
+                if resolved_content == vault_content:
+                    self._mark_synced(note_name, vault_hash, local_file_path)
+                elif self.create_or_update_note(note_path, resolved_content):
+                    self._mark_synced(note_name, self._hash_bytes(resolved_content), local_file_path)
+                self.logger.info(f"🔄 Updated: {note_name}")
+                return "updated"
+            else:
+                # Create new file
+                if not self.dry_run:
+                    _atomic_write_bytes(local_file_path, vault_content, fsync=False)
+                self._mark_synced(note_name, vault_hash, local_file_path)
+                self.logger.info(f"✅ Created: {note_name}")
+                return "created"
+                
+        except Exception as e:
+            self.logger.error(f"❌ Error with {note.get('path', 'unknown')}: {e}")
+            return "errors"
 
-    def send_notification(self, message: str, is_error: bool = False):
+    def send_notification(self, message: str, is_error: bool = False) -> None:
         """Send notification (Slack, etc.)"""
         if not (self.config.enable_slack and self.config.slack_webhook_url):
             return
@@ -449,7 +822,7 @@ class ObsidianSyncManager:
 
     def bidirectional_sync(self) -> Dict[str, Union[Dict[str, int], float, str]]:
         """Execute bidirectional synchronization"""
-        start_time = datetime.now()
+        start_time = time.monotonic()
         self.logger.info("🔄 Starting bidirectional synchronization...")
         self.logger.info(f"📁 Local: {self.local_notes_dir}")
         self.logger.info(f"🗂️ Vault: {self.vault_path}")
@@ -471,10 +844,10 @@ class ObsidianSyncManager:
             obsidian_to_local = self.sync_obsidian_to_local()
             
             # Display results
-            duration = datetime.now() - start_time
+            duration = time.monotonic() - start_time
             self.logger.info("=" * 50)
             self.logger.info("🎉 Synchronization complete!")
-            self.logger.info(f"⏱️ Duration: {duration.total_seconds():.2f}s")
+            self.logger.info(f"⏱️ Duration: {duration:.2f}s")
             self.logger.info(f"📤 Local→Obsidian: created {local_to_obsidian['created']}, "
                            f"updated {local_to_obsidian['updated']}, "
                            f"skipped {local_to_obsidian['skipped']}, "
@@ -491,13 +864,13 @@ class ObsidianSyncManager:
             if total_changes > 0 and self.config.notify_on_success:
                 self.send_notification(
                     f"Synchronization complete - {total_changes} files changed "
-                    f"(duration: {duration.total_seconds():.1f}s)"
+                    f"(duration: {duration:.1f}s)"
                 )
             
             return {
                 "local_to_obsidian": local_to_obsidian,
                 "obsidian_to_local": obsidian_to_local,
-                "duration_seconds": duration.total_seconds(),
+                "duration_seconds": duration,
                 "backup_path": str(backup_path) if backup_path else None
             }
             
@@ -507,9 +880,34 @@ class ObsidianSyncManager:
                 self.send_notification(f"Synchronization failed: {e}", is_error=True)
             raise
 
-    def watch_mode(self, interval: Optional[int] = None):
-        """Continuous monitoring mode"""
-        sync_interval = interval or self.config.sync_interval_seconds
+    async def bidirectional_sync_async(self) -> Dict[str, Union[Dict[str, int], float, str]]:
+        """
+        Execute bidirectional synchronization without blocking the event loop
+        
+        The sync runs on a worker thread; its per-file requests are already
+        issued concurrently over the pooled session.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.bidirectional_sync)
+
+    def watch_mode(self, interval: Optional[int] = None,
+                   on_sync: Optional[Callable[[Dict], None]] = None) -> None:
+        """
+        Continuous monitoring mode
+        
+        The wait between syncs adapts to activity: it doubles after a sync
+        with no changes (up to sync.max_interval_seconds), halves after a
+        sync with changes (down to sync.min_interval_seconds) and returns to
+        the starting interval after a failed sync.
+        
+        Args:
+            interval: Starting sync interval in seconds (None for configured interval)
+            on_sync: Optional callback receiving each successful sync's results
+        """
+        base_interval = interval or self.config.sync_interval_seconds
+        min_interval = min(self.config.sync_min_interval_seconds, base_interval)
+        max_interval = max(self.config.sync_max_interval_seconds, base_interval)
+        sync_interval = base_interval
         
         self.logger.info(f"👀 Starting continuous monitoring (interval: {sync_interval}s)")
         self.logger.info("Press Ctrl+C to stop")
@@ -517,9 +915,22 @@ class ObsidianSyncManager:
         try:
             while True:
                 try:
-                    self.bidirectional_sync()
+                    results = self.bidirectional_sync()
+                    if on_sync:
+                        on_sync(results)
+                    
+                    changes = sum(
+                        stats['created'] + stats['updated']
+                        for stats in (cast(Dict[str, int], results['local_to_obsidian']),
+                                      cast(Dict[str, int], results['obsidian_to_local']))
+                    )
+                    if changes:
+                        sync_interval = max(min_interval, sync_interval // 2)
+                    else:
+                        sync_interval = min(max_interval, sync_interval * 2)
                 except Exception as e:
                     self.logger.error(f"Synchronization error: {e}")
+                    sync_interval = base_interval
                 
                 self.logger.info(f"😴 Waiting {sync_interval}s...")
                 time.sleep(sync_interval)
@@ -6,8 +6,11 @@ Tests for configuration module
 import pytest
 import tempfile
 import os
+import stat
+import yaml
+import logging
 from pathlib import Path
-from obsidian_project_sync.config import ProjectConfig
+from obsidian_project_sync.config import ProjectConfig, _SizeTrackingRotatingFileHandler
 
 
 class TestProjectConfig:
@@ -86,4 +89,249 @@ sync:
             assert 'project_root' in summary
             assert 'vault_project_path' in summary
             assert 'has_api_key' in summary
-            assert summary['has_api_key'] is True
\ No newline at end of file
+            assert summary['has_api_key'] is True
+    
+    def test_update_config_refreshes_values(self):
+        """Test cached values follow configuration updates"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            assert config.sync_interval_seconds == 30
+            
+            config.update_config({'sync': {'interval_seconds': 90}})
+            assert config.sync_interval_seconds == 90
+            assert config.conflict_resolution == 'newer_wins'
+            
+            config.override('logging.level', 'DEBUG')
+            assert config.log_level == 'DEBUG'
+            assert ProjectConfig(project_root).log_level == 'INFO'
+    
+    def test_non_mapping_config_uses_defaults(self):
+        """Test a YAML config whose top level is not a mapping falls back to defaults"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            (project_root / 'obsidian-sync.yml').write_text('- not\n- a mapping\n')
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            assert config.sync_interval_seconds == 30
+            assert config.local_notes_dir == project_root / 'notes'
+    
+    def test_file_filters(self):
+        """Test include extension and exclude pattern matching"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            
+            assert config.has_included_extension('note.md')
+            assert not config.has_included_extension('image.png')
+            assert config.is_excluded('.hidden.md')
+            assert config.is_excluded('draft.tmp')
+            assert not config.is_excluded('note.md')
+            
+            config.update_config({'filters': {'exclude_patterns': []}})
+            assert not config.is_excluded('.hidden.md')
+    
+    def test_env_file_in_parent_directory(self):
+        """Test .env lookup in parent directories"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir) / 'workspace' / 'project'
+            project_root.mkdir(parents=True)
+            (Path(temp_dir) / '.env').write_text('OBSIDIAN_SYNC_TEST_VAR=from-parent\n')
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            os.environ.pop('OBSIDIAN_SYNC_TEST_VAR', None)
+            
+            try:
+                ProjectConfig(project_root)
+                assert os.environ['OBSIDIAN_SYNC_TEST_VAR'] == 'from-parent'
+                
+                # A changed .env is parsed again on the next instantiation
+                env_file = Path(temp_dir) / '.env'
+                env_file.write_text('OBSIDIAN_SYNC_TEST_VAR=updated\n')
+                st = env_file.stat()
+                os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+                del os.environ['OBSIDIAN_SYNC_TEST_VAR']
+                
+                ProjectConfig(project_root)
+                assert os.environ['OBSIDIAN_SYNC_TEST_VAR'] == 'updated'
+                
+                # A removed .env triggers a new search that finds one closer to the project
+                env_file.unlink()
+                (project_root / '.env').write_text('OBSIDIAN_SYNC_TEST_VAR=from-project\n')
+                del os.environ['OBSIDIAN_SYNC_TEST_VAR']
+                
+                ProjectConfig(project_root)
+                assert os.environ['OBSIDIAN_SYNC_TEST_VAR'] == 'from-project'
+                
+                # A .env created nearer the project takes over while the outer one still exists
+                (project_root / '.env').unlink()
+                (Path(temp_dir) / 'workspace' / '.env').write_text('OBSIDIAN_SYNC_TEST_VAR=from-parent\n')
+                del os.environ['OBSIDIAN_SYNC_TEST_VAR']
+                ProjectConfig(project_root)
+                assert os.environ['OBSIDIAN_SYNC_TEST_VAR'] == 'from-parent'
+                
+                (project_root / '.env').write_text('OBSIDIAN_SYNC_TEST_VAR=from-project\n')
+                del os.environ['OBSIDIAN_SYNC_TEST_VAR']
+                
+                ProjectConfig(project_root)
+                assert os.environ['OBSIDIAN_SYNC_TEST_VAR'] == 'from-project'
+            finally:
+                os.environ.pop('OBSIDIAN_SYNC_TEST_VAR', None)
+    
+    def test_default_config_file_respects_umask(self):
+        """Test a newly created config file gets its mode from the umask"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            old_umask = os.umask(0o077)
+            try:
+                config = ProjectConfig(project_root)
+            finally:
+                os.umask(old_umask)
+            
+            assert stat.S_IMODE(config.config_file.stat().st_mode) == 0o600
+    
+    def test_update_config_saves_file(self):
+        """Test configuration updates are written to the config file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            (project_root / 'config').mkdir()
+            (project_root / 'config' / 'obsidian-sync.yml').write_text('sync:\n  interval_seconds: 60\n')
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            config.update_config({'obsidian': {'vault_project_path': 'saved-project'}})
+            
+            assert [p.name for p in (project_root / 'config').iterdir()] == ['obsidian-sync.yml']
+            reloaded = ProjectConfig(project_root)
+            assert reloaded.vault_project_path == 'saved-project'
+            assert reloaded.sync_interval_seconds == 60
+    
+    def test_setup_logging_writes_log_file(self):
+        """Test log records reach the log file through the background listener"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            logger = config.setup_logging()
+            logger.warning("queued log record")
+            config.close()
+            
+            assert "queued log record" in config.log_file.read_text(encoding='utf-8')
+    
+    def test_log_file_rollover(self):
+        """Test the log file rolls over once it reaches max size"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / 'sync.log'
+            handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=100, backupCount=2)
+            record = logging.LogRecord('test', logging.INFO, __file__, 1, 'x' * 40, None, None)
+            try:
+                for _ in range(3):
+                    handler.emit(record)
+            finally:
+                handler.close()
+            
+            assert (Path(temp_dir) / 'sync.log.1').read_text() == ('x' * 40 + '\n') * 2
+            assert log_file.read_text() == 'x' * 40 + '\n'
+    
+    def test_log_file_rollover_picks_up_external_writes(self):
+        """Test the size is re-read after a rollover to include other writers"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / 'sync.log'
+            handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=100, backupCount=2)
+            record = logging.LogRecord('test', logging.INFO, __file__, 1, 'x' * 40, None, None)
+            try:
+                for _ in range(3):
+                    handler.emit(record)
+                # Another process appends to the fresh file
+                with open(log_file, 'a') as f:
+                    f.write('y' * 40 + '\n')
+                handler.emit(record)
+            finally:
+                handler.close()
+            
+            assert (Path(temp_dir) / 'sync.log.1').read_text() == 'x' * 40 + '\n' + 'y' * 40 + '\n'
+            assert log_file.read_text() == 'x' * 40 + '\n'
+    
+    def test_log_file_without_backups_not_rolled_over(self):
+        """Test a log without backups is never rolled over"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / 'sync.log'
+            handler = _SizeTrackingRotatingFileHandler(log_file, maxBytes=100)
+            record = logging.LogRecord('test', logging.INFO, __file__, 1, 'x' * 40, None, None)
+            try:
+                for _ in range(3):
+                    handler.emit(record)
+            finally:
+                handler.close()
+            
+            assert log_file.read_text() == ('x' * 40 + '\n') * 3
+            assert not (Path(temp_dir) / 'sync.log.1').exists()
+    
+    def test_special_log_file_not_rolled_over(self):
+        """Test a log target that is not a regular file is never rolled over"""
+        handler = _SizeTrackingRotatingFileHandler(os.devnull, maxBytes=10, backupCount=1)
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'x' * 40, None, None)
+        try:
+            assert not any(handler.shouldRollover(record) for _ in range(3))
+        finally:
+            handler.close()
+    
+    def test_default_config_file_matches_defaults(self):
+        """Test the pre-rendered default config file matches the default config"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir) / 'my: project'
+            project_root.mkdir()
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            
+            with open(config.config_file, 'r', encoding='utf-8') as f:
+                assert yaml.safe_load(f) == config._get_default_config()
+    
+    def test_iter_local_notes(self):
+        """Test local notes listing applies file filters"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            notes_dir = project_root / 'notes'
+            (notes_dir / 'subdir.md').mkdir(parents=True)
+            for name in ('a.md', 'b.md', '.hidden.md', 'c.txt', 'd.md.bak'):
+                (notes_dir / name).write_text('content')
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            
+            assert sorted(e.name for e in config.iter_local_notes()) == ['a.md', 'b.md']
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for conflict resolution module
+"""
+
+import tempfile
+import pytest
+from pathlib import Path
+from obsidian_project_sync.conflict_resolver import (
+    BackupAndResolveResolver,
+    ConflictResolver,
+    LocalWinsResolver,
+    get_conflict_resolver,
+)
+
+
+class TestConflictResolver:
+    """Test conflict resolution strategies"""
+    
+    def test_factory_backup_wrapping(self):
+        """Test resolvers are wrapped with backups only when enabled"""
+        assert isinstance(get_conflict_resolver('local_wins'), BackupAndResolveResolver)
+        assert isinstance(get_conflict_resolver('local_wins', create_backup=False), LocalWinsResolver)
+    
+    def test_backup_created_for_conflict(self):
+        """Test both versions are backed up before resolving"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note = Path(temp_dir) / 'note.md'
+            resolver = get_conflict_resolver('obsidian_wins')
+            
+            assert resolver.resolve('local', 'remote', note) == 'remote'
+            
+            backups = sorted(p.name for p in (Path(temp_dir) / 'conflicts').rglob('*.md'))
+            assert backups == ['note_local.md', 'note_obsidian.md']
+    
+    def test_identical_content_skips_backup(self):
+        """Test identical content is returned without creating backups"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note = Path(temp_dir) / 'note.md'
+            resolver = get_conflict_resolver('obsidian_wins')
+            
+            assert resolver.resolve('same', 'same', note) == 'same'
+            assert not (Path(temp_dir) / 'conflicts').exists()
+    
+    def test_merge_prefers_superset(self):
+        """Test merge picks the side whose lines contain the other's"""
+        resolver = get_conflict_resolver('merge', create_backup=False)
+        
+        assert resolver.resolve('a\nb', 'a\nb\nc', 'note.md') == 'a\nb\nc'
+        assert resolver.resolve('a\nb\nc', 'c\na', 'note.md') == 'a\nb\nc'
+    
+    def test_large_backup_written(self):
+        """Test large conflict backups are fully written"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note = Path(temp_dir) / 'note.md'
+            local, remote = 'l' * 100000, 'r' * 100000
+            
+            get_conflict_resolver('local_wins').resolve(local, remote, note)
+            
+            backup_dir = next((Path(temp_dir) / 'conflicts').iterdir())
+            assert (backup_dir / 'note_local.md').read_text() == local
+            assert (backup_dir / 'note_obsidian.md').read_text() == remote
+    
+    def test_newer_wins_identical_content(self):
+        """Test identical content is returned even when the local file is missing"""
+        resolver = get_conflict_resolver('newer_wins', create_backup=False)
+        
+        assert resolver.resolve('same', 'same', '/nonexistent/note.md') == 'same'
+    
+    def test_factory_reuses_resolver(self):
+        """Test repeated factory calls return the same resolver"""
+        assert get_conflict_resolver('merge') is get_conflict_resolver('merge')
+        assert get_conflict_resolver('merge') is not get_conflict_resolver('merge', create_backup=False)
+    def test_resolver_interface(self):
+        """Test custom resolvers must implement resolve()"""
+        class Incomplete(ConflictResolver):
+            pass
+        
+        with pytest.raises(TypeError):
+            Incomplete()
+        assert isinstance(get_conflict_resolver('merge'), ConflictResolver)
+    
+    
+    def test_bytes_content(self):
+        """Test resolvers and backups accept raw UTF-8 bytes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note = Path(temp_dir) / 'note.md'
+            local, remote = 'a\nb'.encode('utf-8'), 'a\nb\n한글'.encode('utf-8')
+            
+            assert get_conflict_resolver('merge').resolve(local, remote, note) == remote
+            
+            backup_dir = next((Path(temp_dir) / 'conflicts').iterdir())
+            assert (backup_dir / 'note_obsidian.md').read_bytes() == remote
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for project initialization module
+"""
+
+import os
+import tempfile
+import yaml
+from pathlib import Path
+from obsidian_project_sync.config import ProjectConfig
+from obsidian_project_sync.init_project import ProjectInitializer
+
+
+class TestProjectInitializer:
+    """Test project initialization"""
+    
+    def test_initialize_project(self):
+        """Test initialization creates config, templates and example note"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            
+            assert ProjectInitializer().initialize_project(project_root, project_name='demo')
+            
+            assert (project_root / 'config' / 'obsidian-sync.yml').exists()
+            assert (project_root / '.env.example').exists()
+            assert b'obsidian-sync:' in (project_root / 'Makefile').read_bytes()
+            
+            note = (project_root / 'notes' / 'demo.md').read_text(encoding='utf-8')
+            assert note.startswith('# demo\n')
+            assert 'main project hub for demo.' in note
+    
+    def test_config_file_matches_defaults(self):
+        """Test the initialized config file matches the default config"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir) / 'demo'
+            project_root.mkdir()
+            
+            assert ProjectInitializer().initialize_project(project_root, project_name='demo')
+            
+            # Set required environment variables
+            os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+            os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+            
+            config = ProjectConfig(project_root)
+            
+            with open(project_root / 'config' / 'obsidian-sync.yml', 'r', encoding='utf-8') as f:
+                assert yaml.safe_load(f) == config._get_default_config()
+    
+    def test_existing_example_note_kept(self):
+        """Test an existing example note is not overwritten"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            (project_root / 'notes').mkdir()
+            (project_root / 'notes' / 'demo.md').write_text('mine')
+            
+            assert ProjectInitializer().initialize_project(project_root, project_name='demo')
+            assert (project_root / 'notes' / 'demo.md').read_text() == 'mine'
+    
+    def test_existing_makefile_targets_kept(self):
+        """Test Makefile targets are not appended twice"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            makefile = project_root / 'Makefile'
+            makefile.write_text('obsidian-watch:\n\t@obsidian-sync --watch\n')
+            
+            assert ProjectInitializer().initialize_project(project_root, project_name='demo')
+            assert makefile.read_text() == 'obsidian-watch:\n\t@obsidian-sync --watch\n'
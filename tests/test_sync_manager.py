@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Tests for synchronization manager
+"""
+
+import asyncio
+import gzip
+import tempfile
+import os
+import stat
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from obsidian_project_sync.config import ProjectConfig
+from obsidian_project_sync.sync_manager import ObsidianSyncManager
+
+
+def _make_manager(project_root: Path) -> ObsidianSyncManager:
+    """Create a sync manager for a temporary project"""
+    os.environ['OBSIDIAN_API_HOST'] = 'https://localhost:27124'
+    os.environ['OBSIDIAN_API_KEY'] = 'test-key'
+    
+    config = ProjectConfig(project_root)
+    config.override('sync.create_backup', False)
+    return ObsidianSyncManager(config)
+
+
+class TestObsidianSyncManager:
+    """Test ObsidianSyncManager class"""
+    
+    def test_sync_local_to_obsidian(self):
+        """Test local files are created, updated or skipped in the vault"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            notes_dir = manager.local_notes_dir
+            notes_dir.mkdir()
+            for name in ('new', 'changed', 'same'):
+                (notes_dir / f'{name}.md').write_text(name, encoding='utf-8')
+            
+            vault = {
+                f'{manager.vault_path}/changed.md': b'old',
+                f'{manager.vault_path}/same.md': b'same',
+            }
+            notes = [{"path": path, "name": path.rsplit('/', 1)[-1]} for path in vault]
+            uploads = {}
+            
+            def put(path, content):
+                uploads[path] = content
+                return True
+            
+            try:
+                with patch.object(manager, 'get_vault_notes', return_value=notes), \
+                        patch.object(manager, '_get_note_bytes', side_effect=vault.get) as get, \
+                        patch.object(manager, 'create_or_update_note', side_effect=put):
+                    stats = manager.sync_local_to_obsidian()
+                    
+                    # New notes are created without fetching them first
+                    assert sorted(call.args[0] for call in get.call_args_list) == [
+                        f'{manager.vault_path}/changed.md', f'{manager.vault_path}/same.md'
+                    ]
+                    
+                    # Notes unchanged since the last sync are neither read nor fetched again
+                    get.reset_mock()
+                    notes.append({"path": f'{manager.vault_path}/new.md', "name": 'new.md'})
+                    with patch.object(manager, '_read_local') as read:
+                        assert manager.sync_local_to_obsidian()["skipped"] == 3
+                    assert get.call_count == 0
+                    assert read.call_count == 0
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert stats == {"created": 1, "updated": 1, "skipped": 1, "errors": 0}
+            assert uploads[f'{manager.vault_path}/new.md'] == b'new'
+            assert f'{manager.vault_path}/same.md' not in uploads
+            assert (notes_dir / '.sync_cache.json').exists()
+    
+    def test_sync_obsidian_to_local(self):
+        """Test vault notes are written to the local notes folder"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            vault = {
+                f'{manager.vault_path}/{name}.md': f'{name} content'.encode('utf-8')
+                for name in ('one', 'two', 'three')
+            }
+            notes = [{"path": path, "name": path.rsplit('/', 1)[-1]} for path in vault]
+            
+            try:
+                with patch.object(manager, 'get_vault_notes', return_value=notes), \
+                        patch.object(manager, '_get_note_bytes', side_effect=vault.get):
+                    stats = manager.sync_obsidian_to_local()
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert stats["created"] == 3
+            assert (manager.local_notes_dir / 'two.md').read_text(encoding='utf-8') == 'two content'
+            assert not list(manager.local_notes_dir.glob('*.tmp'))
+    
+    def test_large_identical_note_not_read(self):
+        """Test large local notes matching the vault are compared without reading them"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            content = b'large note\n' * 30000
+            manager.local_notes_dir.mkdir()
+            (manager.local_notes_dir / 'big.md').write_bytes(content)
+            note_path = f'{manager.vault_path}/big.md'
+            
+            try:
+                with patch.object(manager, 'get_vault_notes', return_value=[{"path": note_path, "name": 'big.md'}]), \
+                        patch.object(manager, '_get_note_bytes', return_value=content), \
+                        patch.object(manager, '_read_local') as read:
+                    stats = manager.sync_obsidian_to_local()
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert stats["skipped"] == 1
+            assert read.call_count == 0
+    
+    def test_large_note_hashed_in_chunks(self):
+        """Test large notes hash the same in chunks as in one piece"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            note = Path(temp_dir) / 'big.md'
+            content = bytes(range(256)) * 2000
+            note.write_bytes(content)
+            
+            try:
+                assert manager._hash_local(note)[:2] == (None, manager._hash_bytes(content))
+            finally:
+                manager.close()
+                manager.config.close()
+    
+    def test_create_backup_copies_notes(self):
+        """Test backups copy note contents into a timestamped folder"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            manager.config.override('sync.create_backup', True)
+            manager.local_notes_dir.mkdir()
+            (manager.local_notes_dir / 'note.md').write_text('backed up', encoding='utf-8')
+            
+            try:
+                backup_dir = manager.create_backup()
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert (backup_dir / 'note.md').read_text(encoding='utf-8') == 'backed up'
+    
+    def test_bidirectional_sync_async(self):
+        """Test the async wrapper returns the synchronous sync results"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            
+            try:
+                with patch.object(manager, 'bidirectional_sync', return_value={"duration_seconds": 0.0}):
+                    results = asyncio.run(manager.bidirectional_sync_async())
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert results == {"duration_seconds": 0.0}
+    
+    def test_notes_uploaded_in_pass_not_fetched_back(self):
+        """Test Obsidian → Local skips notes Local → Obsidian just uploaded"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            manager.local_notes_dir.mkdir()
+            (manager.local_notes_dir / 'note.md').write_text('local', encoding='utf-8')
+            note_path = f'{manager.vault_path}/note.md'
+            other_path = f'{manager.vault_path}/other.md'
+            listing = [{"path": other_path, "name": 'other.md'}]
+            
+            try:
+                with patch.object(manager, 'get_vault_notes', return_value=listing), \
+                        patch.object(manager, '_get_note_bytes', return_value=b'other') as get, \
+                        patch.object(manager, 'create_or_update_note', return_value=True):
+                    manager.sync_local_to_obsidian()
+                    listing.append({"path": note_path, "name": 'note.md'})
+                    stats = manager.sync_obsidian_to_local()
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert [call.args[0] for call in get.call_args_list] == [other_path]
+            assert stats == {"created": 1, "updated": 0, "skipped": 1, "errors": 0}
+    
+    def test_cleanup_old_backups_keeps_newest(self):
+        """Test cleanup keeps the newest backups by timestamped name"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            backup_root = Path(temp_dir) / 'notes_backup'
+            names = ['20240101_000000', '20240301_000000', '20240201_000000']
+            for name in names:
+                (backup_root / name).mkdir(parents=True)
+            
+            try:
+                manager.cleanup_old_backups(max_backups=2)
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert sorted(os.listdir(backup_root)) == ['20240201_000000', '20240301_000000']
+    
+    def test_watch_mode_adapts_interval(self):
+        """Test watch mode backs off while idle, speeds up on changes and resets on failure"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            
+            def result(changes):
+                stats = {"created": 0, "updated": changes, "skipped": 0, "errors": 0}
+                return {"local_to_obsidian": stats, "obsidian_to_local": dict(stats, updated=0)}
+            
+            outcomes = [result(0), result(0), result(3), RuntimeError("offline"), result(0)]
+            sleeps = []
+            
+            def sleep(seconds):
+                sleeps.append(seconds)
+                if len(sleeps) == len(outcomes):
+                    raise KeyboardInterrupt
+            
+            try:
+                with patch.object(manager, 'bidirectional_sync', side_effect=outcomes), \
+                        patch('obsidian_project_sync.sync_manager.time.sleep', side_effect=sleep):
+                    manager.watch_mode(interval=30)
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert sleeps == [60, 120, 60, 30, 60]
+    
+    def test_compressed_upload(self):
+        """Test large notes are gzipped on upload when compression is enabled"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            manager.close()
+            manager.config.override('sync.compress_uploads', True)
+            manager = ObsidianSyncManager(manager.config)
+            content = b'# Note\n' * 1024
+            
+            try:
+                with patch.object(manager, '_put', return_value=MagicMock(status_code=204)) as put:
+                    assert manager.create_or_update_note('vault/small.md', b'small')
+                    assert manager.create_or_update_note('vault/large.md', content)
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            small, large = put.call_args_list
+            assert small.args[1] == b'small'
+            assert 'Content-Encoding' not in small.kwargs['headers']
+            assert gzip.decompress(large.args[1]) == content
+            assert large.kwargs['headers']['Content-Encoding'] == 'gzip'
+    
+    def _sync_obsidian_wins(self, project_root: Path, note_path: Path, vault_content: bytes) -> None:
+        """Run Obsidian → Local with obsidian_wins for a single vault note"""
+        manager = _make_manager(project_root)
+        manager.close()
+        config = manager.config
+        config.override('sync.conflict_resolution', 'obsidian_wins')
+        manager = ObsidianSyncManager(config)
+        vault_note = f'{manager.vault_path}/{note_path.name}'
+        
+        try:
+            with patch.object(manager, 'get_vault_notes', return_value=[{"path": vault_note, "name": note_path.name}]), \
+                    patch.object(manager, '_get_note_bytes', return_value=vault_content):
+                assert manager.sync_obsidian_to_local()["updated"] == 1
+        finally:
+            manager.close()
+            manager.config.close()
+    
+    def test_symlinked_note_target_updated(self):
+        """Test updating a symlinked note writes through to its target"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            target = project_root / 'shared.md'
+            target.write_bytes(b'local')
+            (project_root / 'notes').mkdir()
+            link = project_root / 'notes' / 'note.md'
+            link.symlink_to(target)
+            
+            self._sync_obsidian_wins(project_root, link, b'vault')
+            
+            assert link.is_symlink()
+            assert target.read_bytes() == b'vault'
+    
+    def test_note_permissions_kept(self):
+        """Test updating a note keeps its file mode"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_root = Path(temp_dir)
+            (project_root / 'notes').mkdir()
+            note = project_root / 'notes' / 'note.md'
+            note.write_bytes(b'local')
+            note.chmod(0o600)
+            
+            self._sync_obsidian_wins(project_root, note, b'vault')
+            
+            assert note.read_bytes() == b'vault'
+            assert stat.S_IMODE(note.stat().st_mode) == 0o600
+    
+    def test_etag_cache_pruned_by_listing(self):
+        """Test cached note bodies are dropped once notes leave the vault"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            kept = f'{manager.vault_path}/kept.md'
+            manager._etag_cache[kept] = ('"1"', b'kept')
+            manager._etag_cache[f'{manager.vault_path}/gone.md'] = ('"2"', b'gone')
+            response = MagicMock(content=b'{"files": ["kept.md"]}')
+            
+            try:
+                with patch.object(manager, '_get', return_value=response):
+                    assert [note["path"] for note in manager.get_vault_notes()] == [kept]
+            finally:
+                manager.close()
+                manager.config.close()
+            
+            assert list(manager._etag_cache) == [kept]
+    
+    def test_new_note_respects_umask(self):
+        """Test a note created from the vault gets its mode from the umask"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = _make_manager(Path(temp_dir))
+            note_path = f'{manager.vault_path}/private.md'
+            
+            old_umask = os.umask(0o077)
+            try:
+                with patch.object(manager, 'get_vault_notes', return_value=[{"path": note_path, "name": 'private.md'}]), \
+                        patch.object(manager, '_get_note_bytes', return_value=b'private'):
+                    assert manager.sync_obsidian_to_local()["created"] == 1
+            finally:
+                os.umask(old_umask)
+                manager.close()
+                manager.config.close()
+            
+            note = manager.local_notes_dir / 'private.md'
+            assert note.read_bytes() == b'private'
+            assert stat.S_IMODE(note.stat().st_mode) == 0o600